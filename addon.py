@@ -1,14 +1,303 @@
 import bpy
+import bmesh
+import numpy as np
 import json
 import threading
 import socket
+import selectors
 import time
 import requests  # Add this import for HTTP requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile  # Add this import for temporary directories
 from bpy.props import StringProperty, IntProperty
-import traceback
+import logging
 import os
 import shutil
+import re
+import functools
+import hashlib
+import itertools
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Quiet by default (WARNING); set BLENDERMCP_DEBUG=1 to see per-command logs and tracebacks
+logger = logging.getLogger("blendermcp")
+if os.environ.get("BLENDERMCP_DEBUG") == "1":
+    logger.setLevel(logging.DEBUG)
+    if not logger.handlers:  # Reloading the addon re-runs this; don't print every line twice
+        logger.addHandler(logging.StreamHandler())
+
+try:
+    import orjson  # Optional; not bundled with Blender's Python
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Shared HTTP session so Poly Haven requests reuse pooled keep-alive connections
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,  # Room for the concurrent texture and include downloads
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+_HTTP.headers.update({"Accept-Encoding": "gzip", "User-Agent": "blender-mcp"})
+_HTTP_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+
+# One bounded pool for all file downloads, so concurrent jobs never exceed 8 transfers to Polyhaven
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="blendermcp-download")
+
+_POLYHAVEN_CATEGORIES_URL = "https://api.polyhaven.com/categories/%s"
+_POLYHAVEN_ASSETS_URL = "https://api.polyhaven.com/assets"
+_POLYHAVEN_FILES_URL = "https://api.polyhaven.com/files/%s"
+
+@functools.lru_cache(maxsize=None)
+def _scratch_dir():
+    """Local directory for downloads: BLENDERMCP_TMP, then RAM-backed /dev/shm, then the system temp dir"""
+    for candidate in (os.environ.get("BLENDERMCP_TMP"), "/dev/shm", tempfile.gettempdir()):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+# Model download directories are named with this prefix so leftovers can be found
+_MODEL_DIR_PREFIX = "blendermcp_"
+
+def _remove_stale_model_dirs(directory):
+    """Delete model directories a previous session could not clean up (e.g. files held open on Windows)"""
+    cutoff = time.time() - 24 * 60 * 60  # Old enough that no import can still be using it
+    try:
+        with os.scandir(directory) as it:
+            stale = [entry.path for entry in it
+                     if entry.name.startswith(_MODEL_DIR_PREFIX) and entry.is_dir()
+                     and entry.stat().st_mtime < cutoff]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+# Downloaded Polyhaven files, revalidated with conditional GETs on reuse
+_CACHE_DIR = os.path.join(bpy.utils.user_resource('DATAFILES'), "blendermcp", "polyhaven")
+_CACHE_MAX_BYTES = int(os.environ.get("BLENDERMCP_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+_cache_lock = threading.Lock()  # Downloads store and prune from several threads
+
+def _prune_cache(keep):
+    """Evict least recently used cache entries (never keep) until the cache fits in _CACHE_MAX_BYTES"""
+    with _cache_lock:
+        entries = []
+        total = 0
+        with os.scandir(_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith((".json", ".tmp")) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+                total += stat.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= _CACHE_MAX_BYTES:
+                break
+            if path == keep:
+                continue
+            for stale in (path, path + ".json"):
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+            total -= size
+
+def _fetch_cached(url, revalidate=True):
+    """Bring url's body into the download cache; returns (cached path or None, HTTP status); revalidate=False always downloads in full"""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    path = os.path.join(_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest())
+    meta_path = path + ".json"
+    
+    headers = {}
+    if revalidate and os.path.exists(path):
+        try:
+            with open(meta_path, "rb") as f:
+                meta = _json_loads(f.read())
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    
+    with _HTTP.get(url, stream=True, headers=headers, timeout=_HTTP_TIMEOUT) as response:
+        if response.status_code == 304:
+            try:
+                os.utime(path)  # Mark as recently used; atime may not be updated on reads
+            except FileNotFoundError:
+                # Pruned by another download since the check; fetch it again in full
+                return _fetch_cached(url, revalidate=False)
+            return path, response.status_code
+        if response.status_code != 200:
+            return None, response.status_code
+        
+        # Write beside the cache entry and swap it in atomically
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        response.raw.decode_content = True
+        try:
+            with open(tmp_path, "wb", buffering=1024 * 1024) as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with open(meta_path, "wb") as f:
+            f.write(_json_dumps(meta))
+    
+    _prune_cache(keep=path)
+    return path, 200
+
+def _copy_cached(url, dest):
+    """Copy url's body (through the download cache) to dest; returns 200 once it is there, else the HTTP status"""
+    cached_path, status = _fetch_cached(url)
+    if cached_path is None:
+        return status
+    try:
+        shutil.copyfile(cached_path, dest)
+    except FileNotFoundError:
+        # Another download pruned the entry after it was revalidated; fetch it again in full
+        cached_path, status = _fetch_cached(url, revalidate=False)
+        if cached_path is None:
+            return status
+        shutil.copyfile(cached_path, dest)
+    return 200
+
+def _download_to_temp(url, suffix):
+    """Copy url (through the download cache) into a new temporary file; None on HTTP errors"""
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix, dir=_scratch_dir())
+    os.close(fd)
+    try:
+        status = _copy_cached(url, tmp_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    if status != 200:
+        os.unlink(tmp_path)
+        return None
+    return tmp_path
+
+def _download_to_path(url, path):
+    """Copy url (through the download cache) to path, whose directory must exist; returns 200 once it is there, else the HTTP status"""
+    # Copy under a temporary name so a failed copy never leaves a truncated file at path
+    part_path = path + ".part"
+    status = _copy_cached(url, part_path)
+    if status == 200:
+        os.replace(part_path, path)
+    return status
+
+def _vec3(v):
+    """A mathutils Vector/Euler as a plain tuple, converted in one C-level iteration"""
+    return tuple(v)
+
+def _lookup(data, *keys):
+    """Walk keys into nested manifest dicts; None if any level is missing"""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+# Linear colorspace names across Blender versions, in order of preference
+_LINEAR_COLORSPACES = ('Linear', 'Linear Rec.709', 'Non-Color')
+_linear_colorspace = None  # First name this Blender build accepted
+
+def _set_linear_colorspace(image):
+    """Give image a linear colorspace, probing for a supported name only once"""
+    global _linear_colorspace
+    if _linear_colorspace is not None:
+        image.colorspace_settings.name = _linear_colorspace
+        return
+    for name in _LINEAR_COLORSPACES:
+        try:
+            image.colorspace_settings.name = name
+        except TypeError:  # Not an enum item in this build
+            continue
+        _linear_colorspace = name
+        return
+
+# Lower-cased Polyhaven map type -> canonical map feeding a Principled BSDF input
+_MAP_ALIAS = {
+    alias: canonical
+    for canonical, aliases in {
+        'color': ('color', 'diffuse', 'albedo'),
+        'roughness': ('roughness', 'rough'),
+        'metallic': ('metallic', 'metalness', 'metal'),
+        'normal': ('normal', 'nor', 'dx', 'gl'),
+        'displacement': ('displacement', 'disp', 'height'),
+    }.items()
+    for alias in aliases
+}
+
+# Model formats to pick when none is requested: single-file glb needs no include downloads
+_MODEL_FORMAT_PREFERENCE = ('glb', 'gltf', 'fbx', 'obj', 'blend')
+
+# Model format -> importer (blend files are appended separately)
+_MODEL_IMPORTERS = {
+    'gltf': lambda path: bpy.ops.import_scene.gltf(filepath=path),
+    'glb': lambda path: bpy.ops.import_scene.gltf(filepath=path),
+    'fbx': lambda path: bpy.ops.import_scene.fbx(filepath=path),
+    'obj': lambda path: bpy.ops.import_scene.obj(filepath=path),
+}
+
+# World and node that Polyhaven HDRIs are loaded into
+_HDRI_WORLD_NAME = "MCP_HDRI_World"
+_HDRI_ENV_NODE = "Environment Texture"
+
+# Globals every execute_code snippet starts from
+_EXEC_NAMESPACE = {"bpy": bpy}
+
+@functools.lru_cache(maxsize=128)
+def _compile_code(code):
+    """Compile execute_code source once; clients often resend the same snippet"""
+    return compile(code, "<mcp>", "exec")
+
+# Object types still created through operators: type -> adder(location, rotation, scale, torus_options).
+# bpy.ops is resolved at call time, so these are safe to build at import. They run with a VIEW_3D area override.
+_OPERATOR_OBJECTS = {
+    "TORUS": lambda location, rotation, scale, torus_options: bpy.ops.mesh.primitive_torus_add(
+        location=location, rotation=rotation, **torus_options),
+}
+
+# Non-mesh objects created through the data API: type -> (default name, data factory, applies scale)
+_DATA_OBJECTS = {
+    "EMPTY": ("Empty", lambda name: None, True),
+    # Cameras ignore scale
+    "CAMERA": ("Camera", lambda name: bpy.data.cameras.new(name), False),
+    "LIGHT": ("Light", lambda name: bpy.data.lights.new(name, type='POINT'), True),
+}
+
+# Mesh primitives built with bmesh: type -> (default name, builder). This skips
+# the operator overhead (undo push, poll, depsgraph rebuild) of
+# bpy.ops.mesh.primitive_*_add; sizes match the operator defaults.
+_MESH_PRIMITIVES = {
+    "CUBE": ("Cube", lambda bm: bmesh.ops.create_cube(bm, size=2.0, calc_uvs=True)),
+    "SPHERE": ("Sphere", lambda bm: bmesh.ops.create_uvsphere(
+        bm, u_segments=32, v_segments=16, radius=1.0, calc_uvs=True)),
+    "CYLINDER": ("Cylinder", lambda bm: bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=32, radius1=1.0, radius2=1.0, depth=2.0, calc_uvs=True)),
+    "PLANE": ("Plane", lambda bm: bmesh.ops.create_grid(
+        bm, x_segments=1, y_segments=1, size=1.0, calc_uvs=True)),
+    "CONE": ("Cone", lambda bm: bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=32, radius1=1.0, radius2=0.0, depth=2.0, calc_uvs=True)),
+}
 
 bl_info = {
     "name": "Blender MCP",
@@ -20,25 +309,200 @@ bl_info = {
     "category": "Interface",
 }
 
+def _send_buffers(sock, views):
+    """Send what a non-blocking socket accepts of views, in as few syscalls as possible; returns the unsent rest"""
+    first = 0
+    try:
+        while first < len(views):
+            # Either send may take only part of the data; resume from where it stopped
+            if hasattr(sock, "sendmsg"):
+                sent = sock.sendmsg(views[first:first + 512])
+            else:  # Windows has no scatter/gather send
+                sent = sock.send(views[first])
+            while sent:
+                if sent >= len(views[first]):
+                    sent -= len(views[first])
+                    first += 1
+                else:
+                    views[first] = views[first][sent:]
+                    sent = 0
+    except BlockingIOError:
+        pass  # Socket buffer full; the rest waits for EVENT_WRITE
+    return views[first:]
+
+class CommandBuffer:
+    """Incrementally split a byte stream into complete commands.
+
+    Two framings are accepted: a bare top-level JSON value, or a 4-byte
+    big-endian length prefix followed by the JSON payload. A JSON value
+    always starts with '{' or '[', while a prefix for any realistic
+    payload starts with a low byte, so the framing is detected per frame.
+    """
+
+    _STRUCTURAL = re.compile(rb'[{}\[\]"]')
+    _STRING_SPECIAL = re.compile(rb'["\\]')
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.length_prefixed = False  # Peer sends length-prefixed frames
+        self._pos = 0  # Next byte to scan
+        self._start = 0  # Start of the frame currently being scanned
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def clear(self):
+        self.__init__()
+
+    def feed(self, data):
+        """Append received bytes and return every frame they completed.
+
+        Only the newly received bytes are scanned, so a large command arriving
+        in many small recvs is parsed once instead of once per recv.
+        """
+        buf = self.buffer
+        buf.extend(data)  # Amortized O(1), unlike bytes concatenation
+        # Frames are copied out of the buffer once, through a view
+        view = memoryview(buf)
+        frames = []
+        pos = self._pos
+        end = len(buf)
+        while pos < end:
+            if self._depth == 0:
+                char = buf[pos]
+                if char in b'{[':
+                    self._start = pos
+                    self._depth = 1
+                    pos += 1
+                elif char in b' \t\r\n':
+                    pos += 1
+                else:
+                    # Length-prefixed frame: wait until header and payload are in
+                    if end - pos < 4:
+                        break
+                    frame_end = pos + 4 + int.from_bytes(buf[pos:pos + 4], 'big')
+                    if frame_end > end:
+                        break
+                    frames.append(view[pos + 4:frame_end].tobytes())
+                    self.length_prefixed = True
+                    pos = frame_end
+            elif self._escape:
+                self._escape = False
+                pos += 1
+            elif self._in_string:
+                match = self._STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if buf[match.start()] == 0x5C:  # backslash
+                    self._escape = True
+                else:
+                    self._in_string = False
+            else:
+                match = self._STRUCTURAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                char = buf[match.start()]
+                pos = match.end()
+                if char == 0x22:  # opening quote
+                    self._in_string = True
+                elif char in b'{[':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        frames.append(view[self._start:pos].tobytes())
+
+        # The view must be released before the bytearray can be resized
+        view.release()
+        # Drop consumed bytes once per recv; keep only the unfinished frame
+        consumed = self._start if self._depth else pos
+        del buf[:consumed]
+        self._pos = pos - consumed
+        self._start = 0
+        return frames
+
+
 class BlenderMCPServer:
+    # Most commands executed in one timer tick before yielding back to Blender
+    MAX_COMMANDS_PER_TICK = 32
+    # Seconds a finished job's result waits for poll_job before it is discarded
+    JOB_RESULT_TTL = 600.0
+
+    # Command type -> handler method name, built once at import
+    _BASE_HANDLERS = {
+        "get_simple_info": "get_simple_info",
+        "get_scene_info": "get_scene_info",
+        "create_object": "create_object",
+        "modify_object": "modify_object",
+        "delete_object": "delete_object",
+        "get_object_info": "get_object_info",
+        "execute_code": "execute_code",
+        "set_material": "set_material",
+        "get_polyhaven_status": "get_polyhaven_status",
+        "poll_job": "poll_job",
+        "batch": "batch",
+    }
+
+    _POLYHAVEN_HANDLERS = {
+        "get_polyhaven_categories": "get_polyhaven_categories",
+        "search_polyhaven_assets": "search_polyhaven_assets",
+        "download_polyhaven_asset": "download_polyhaven_asset",
+        "set_texture": "set_texture",
+    }
+
     def __init__(self, host='localhost', port=9876):
         self.host = host
         self.port = port
         self.running = False
         self.socket = None
-        self.client = None
-        self.command_queue = []
-        self.buffer = b''  # Add buffer for incomplete data
+        self.selector = None
+        self._view3d_screen = None  # Screen the cached VIEW_3D area belongs to
+        self._view3d_area = None
+        # Socket I/O runs on its own thread; only command execution stays on the main thread
+        self.clients = {}  # Connected socket -> CommandBuffer for its incomplete data
+        self._unsent = {}  # Connected socket -> response buffers it has not accepted yet
+        self.command_queue = queue.Queue()  # (client, command) read by the I/O thread
+        self.response_queue = queue.Queue()  # (client, response) to be sent by the I/O thread
+        self._io_thread = None
+        # Receive buffer reused for every recv; only the I/O thread touches it
+        self._recv_view = memoryview(bytearray(65536))
+        self._wakeup_recv = None  # Socket pair used to interrupt the I/O thread's select
+        self._wakeup_send = None
+        # Background jobs: network work runs on the worker, bpy work on the timer
+        self._jobs = {}  # job_id -> result, None while still running
+        self._job_expiry = {}  # job_id -> time.monotonic() after which a finished result is dropped
+        self._job_ids = itertools.count(1)
+        self._job_queue = queue.Queue()
+        self._finished_jobs = queue.Queue()
+        self._job_worker = None
     
     def start(self):
         self.running = True
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         
+        # Sweep model downloads an earlier session could not clean up
+        if _scratch_dir():
+            _remove_stale_model_dirs(_scratch_dir())
+        
         try:
             self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
+            self.socket.listen(16)  # Room for a pooled client's simultaneous connects
             self.socket.setblocking(False)
+            self._wakeup_recv, self._wakeup_send = socket.socketpair()
+            self._wakeup_recv.setblocking(False)
+            self._wakeup_send.setblocking(False)  # A full pair must never block the main thread
+            # Readiness is tracked by the selector on the I/O thread
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_READ, self._accept_client)
+            self.selector.register(self._wakeup_recv, selectors.EVENT_READ, self._drain_wakeup)
+            self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+            self._io_thread.start()
+            self._job_worker = threading.Thread(target=self._run_jobs, daemon=True)
+            self._job_worker.start()
             # Register the timer
             bpy.app.timers.register(self._process_server, persistent=True)
             print(f"BlenderMCP server started on {self.host}:{self.port}")
@@ -51,143 +515,289 @@ class BlenderMCPServer:
         if hasattr(bpy.app.timers, "unregister"):
             if bpy.app.timers.is_registered(self._process_server):
                 bpy.app.timers.unregister(self._process_server)
-        if self.socket:
-            self.socket.close()
-        if self.client:
-            self.client.close()
+        io_stopped = True
+        if self._io_thread:
+            self._wake_io_thread()
+            self._io_thread.join(timeout=1.0)
+            io_stopped = not self._io_thread.is_alive()
+        if io_stopped:
+            # Only once the I/O thread is gone is nothing else using these
+            if self.selector:
+                self.selector.close()
+            for client in self.clients:
+                client.close()
+        else:
+            logger.warning("I/O thread did not stop in time; leaving its client sockets open")
+        for sock in (self.socket, self._wakeup_recv, self._wakeup_send):
+            if sock:
+                sock.close()
+        if self._job_worker:
+            self._job_queue.put(None)  # Let the worker exit after its current job
+        self.selector = None
         self.socket = None
-        self.client = None
+        self.clients = {}
+        self._unsent = {}
+        self._io_thread = None
+        self._wakeup_recv = None
+        self._wakeup_send = None
+        self._job_worker = None
         print("BlenderMCP server stopped")
 
     def _process_server(self):
-        """Timer callback to process server operations"""
+        """Timer callback: execute queued commands on the main thread"""
         if not self.running:
             return None  # Unregister timer
             
+        had_activity = False
+        executed = 0
         try:
-            # Accept new connections
-            if not self.client and self.socket:
-                try:
-                    self.client, address = self.socket.accept()
-                    self.client.setblocking(False)
-                    print(f"Connected to client: {address}")
-                except BlockingIOError:
-                    pass  # No connection waiting
-                except Exception as e:
-                    print(f"Error accepting connection: {str(e)}")
-                
-            # Process existing connection
-            if self.client:
+            had_activity = self._finish_jobs()
+            # Run queued commands back to back, but cap the batch so the UI stays responsive
+            while executed < self.MAX_COMMANDS_PER_TICK:
                 try:
-                    # Try to receive data
-                    try:
-                        data = self.client.recv(8192)
-                        if data:
-                            self.buffer += data
-                            # Try to process complete messages
-                            try:
-                                # Attempt to parse the buffer as JSON
-                                command = json.loads(self.buffer.decode('utf-8'))
-                                # If successful, clear the buffer and process command
-                                self.buffer = b''
-                                response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                self.client.sendall(response_json.encode('utf-8'))
-                            except json.JSONDecodeError:
-                                # Incomplete data, keep in buffer
-                                pass
-                        else:
-                            # Connection closed by client
-                            print("Client disconnected")
-                            self.client.close()
-                            self.client = None
-                            self.buffer = b''
-                    except BlockingIOError:
-                        pass  # No data available
-                    except Exception as e:
-                        print(f"Error receiving data: {str(e)}")
-                        self.client.close()
-                        self.client = None
-                        self.buffer = b''
-                        
-                except Exception as e:
-                    print(f"Error with client: {str(e)}")
-                    if self.client:
-                        self.client.close()
-                        self.client = None
-                    self.buffer = b''
-                    
+                    client, command = self.command_queue.get_nowait()
+                except queue.Empty:
+                    break
+                executed += 1
+                response = self.execute_command(command)
+                # Pipelining clients match replies to their commands by this id
+                if isinstance(command, dict) and "request_id" in command:
+                    response["request_id"] = command["request_id"]
+                self.response_queue.put((client, response))
+            had_activity = had_activity or executed > 0
+            if had_activity:
+                self._wake_io_thread()
         except Exception as e:
-            print(f"Server error: {str(e)}")
-            
-        return 0.1  # Continue timer with 0.1 second interval
+            logger.error("Server error: %s", e)
+        
+        # Back off while idle: fast right after traffic, slower with an idle client, slowest alone
+        if executed == self.MAX_COMMANDS_PER_TICK:
+            return 0.0  # More may be queued; run again as soon as Blender allows
+        if had_activity:
+            return 0.01
+        # Only running jobs need the faster cadence; finished ones just wait to be polled
+        jobs_running = len(self._jobs) > len(self._job_expiry)
+        return 0.1 if self.clients or jobs_running else 0.5
 
-    def execute_command(self, command):
-        """Execute a command in the main Blender thread"""
+    def _run_jobs(self):
+        """Job worker: run the fetch step of each job off the main thread"""
+        while True:
+            job = self._job_queue.get()
+            if job is None:
+                return
+            job_id, fetch, finish = job
+            try:
+                fetched = fetch()
+            except Exception as e:
+                fetched = {"error": str(e)}
+            self._finished_jobs.put((job_id, fetched, finish))
+
+    def _finish_jobs(self):
+        """Run the Blender side of fetched jobs on the main thread; True if any finished"""
+        finished = False
+        while True:
+            try:
+                job_id, fetched, finish = self._finished_jobs.get_nowait()
+            except queue.Empty:
+                break
+            finished = True
+            try:
+                self._jobs[job_id] = finish(fetched)
+            except Exception as e:
+                self._jobs[job_id] = {"error": str(e)}
+            self._job_expiry[job_id] = time.monotonic() + self.JOB_RESULT_TTL
+        
+        # Drop results nobody polled for, e.g. because the client went away
+        if self._job_expiry:
+            now = time.monotonic()
+            for job_id in [job_id for job_id, expiry in self._job_expiry.items() if expiry < now]:
+                del self._job_expiry[job_id]
+                del self._jobs[job_id]
+        return finished
+
+    def _submit_job(self, fetch, finish):
+        """Queue fetch() for the worker and finish(fetched) for the main thread"""
+        job_id = next(self._job_ids)
+        self._jobs[job_id] = None
+        self._job_queue.put((job_id, fetch, finish))
+        return job_id
+
+    def poll_job(self, job_id):
+        """Report whether a background job is done; a finished job is reported once"""
+        if job_id not in self._jobs:
+            raise ValueError(f"Unknown job: {job_id}")
+        result = self._jobs[job_id]
+        if result is None:
+            return {"job_id": job_id, "status": "running"}
+        del self._jobs[job_id]
+        del self._job_expiry[job_id]
+        return {"job_id": job_id, "status": "done", "result": result}
+
+    def _io_loop(self):
+        """I/O thread: accept clients, read and decode commands, send responses"""
+        while self.running:
+            try:
+                for key, events in self.selector.select():
+                    if events & selectors.EVENT_WRITE:
+                        self._flush_client(key.fileobj)
+                    # The flush may have closed the client (fileno() is then -1)
+                    if events & selectors.EVENT_READ and key.fileobj.fileno() != -1:
+                        key.data()
+                self._send_responses()
+            except Exception as e:
+                if self.running:
+                    logger.error("Server error: %s", e)
+
+    def _wake_io_thread(self):
+        """Interrupt the I/O thread's select so it sends queued responses"""
         try:
-            cmd_type = command.get("type")
-            params = command.get("params", {})
-            
-            # Ensure we're in the right context
-            if cmd_type in ["create_object", "modify_object", "delete_object"]:
-                override = bpy.context.copy()
-                override['area'] = [area for area in bpy.context.screen.areas if area.type == 'VIEW_3D'][0]
-                with bpy.context.temp_override(**override):
-                    return self._execute_command_internal(command)
+            self._wakeup_send.send(b"\0")
+        except (AttributeError, BlockingIOError, OSError):
+            pass  # Already stopped, or a wakeup is already pending
+
+    def _drain_wakeup(self):
+        """Discard wakeup bytes; their only job was to end the select"""
+        try:
+            while self._wakeup_recv.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _accept_client(self):
+        """Accept a pending connection on the listening socket"""
+        try:
+            client, address = self.socket.accept()
+        except BlockingIOError:
+            return  # Connection went away before accept
+        except Exception as e:
+            logger.error("Error accepting connection: %s", e)
+            return
+        # Non-blocking, so a client that stops reading never stalls the others;
+        # what its socket does not accept waits in _unsent for EVENT_WRITE
+        client.setblocking(False)
+        self.clients[client] = CommandBuffer()
+        self.selector.register(client, selectors.EVENT_READ, functools.partial(self._read_client, client))
+        print(f"Connected to client: {address}")
+
+    def _read_client(self, client):
+        """Read what the client sent and queue every complete command for the main thread"""
+        try:
+            nbytes = client.recv_into(self._recv_view)
+        except BlockingIOError:
+            return  # Spurious readiness; wait for the next select
+        except Exception as e:
+            logger.error("Error receiving data: %s", e)
+            self._close_client(client)
+            return
+        if not nbytes:
+            # Connection closed by client
+            print("Client disconnected")
+            self._close_client(client)
+            return
+        
+        for frame in self.clients[client].feed(self._recv_view[:nbytes]):
+            try:
+                command = _json_loads(frame)
+            except ValueError as e:
+                self.response_queue.put((client, {"status": "error", "message": f"Invalid JSON: {str(e)}"}))
             else:
-                return self._execute_command_internal(command)
-                
+                self.command_queue.put((client, command))
+
+    def _send_responses(self):
+        """Encode queued responses and send what each client's socket accepts"""
+        outgoing = {}
+        while True:
+            try:
+                client, response = self.response_queue.get_nowait()
+            except queue.Empty:
+                break
+            buffer = self.clients.get(client)
+            if buffer is None:
+                continue  # Client left before its answer was ready
+            body = _json_dumps(response)
+            parts = outgoing.setdefault(client, [])
+            # Answer in the framing the client uses
+            if buffer.length_prefixed:
+                parts.append(len(body).to_bytes(4, 'big'))
+            parts.append(body)
+        
+        for client, parts in outgoing.items():
+            self._unsent.setdefault(client, []).extend(memoryview(part) for part in parts)
+            self._flush_client(client)
+
+    def _flush_client(self, client):
+        """Send a client's pending output; watch for EVENT_WRITE only while some is left"""
+        try:
+            unsent = _send_buffers(client, self._unsent.pop(client, []))
         except Exception as e:
-            print(f"Error executing command: {str(e)}")
+            logger.error("Error with client: %s", e)
+            self._close_client(client)
+            return
+        events = selectors.EVENT_READ
+        if unsent:
+            self._unsent[client] = unsent
+            events |= selectors.EVENT_WRITE
+        key = self.selector.get_key(client)
+        if key.events != events:
+            self.selector.modify(client, events, key.data)
+
+    def _close_client(self, client):
+        """Forget a client and close its socket"""
+        self._unsent.pop(client, None)
+        if self.clients.pop(client, None) is not None:
+            self.selector.unregister(client)
+        client.close()
 
-            traceback.print_exc()
+    def execute_command(self, command):
+        """Execute a command in the main Blender thread"""
+        try:
+            return self._execute_command_internal(command)
+        except Exception as e:
+            logger.error("Error executing command: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"status": "error", "message": str(e)}
 
+    def _get_view3d_area(self):
+        """Return a VIEW_3D area of the current screen, rescanning only when the cache is stale"""
+        screen = bpy.context.screen
+        area = self._view3d_area
+        try:
+            if area is not None and self._view3d_screen == screen and area.type == 'VIEW_3D':
+                return area
+        except ReferenceError:
+            pass  # Area was freed along with its screen layout
+
+        area = next((a for a in screen.areas if a.type == 'VIEW_3D'), None)
+        if area is None:
+            raise RuntimeError("No 3D Viewport found in the current screen")
+        self._view3d_screen = screen
+        self._view3d_area = area
+        return area
+
     def _execute_command_internal(self, command):
         """Internal command execution with proper context"""
         cmd_type = command.get("type")
         params = command.get("params", {})
 
-        # Add a handler for checking PolyHaven status
-        if cmd_type == "get_polyhaven_status":
-            return {"status": "success", "result": self.get_polyhaven_status()}
-        
-        # Base handlers that are always available
-        handlers = {
-            "get_scene_info": self.get_scene_info,
-            "create_object": self.create_object,
-            "modify_object": self.modify_object,
-            "delete_object": self.delete_object,
-            "get_object_info": self.get_object_info,
-            "execute_code": self.execute_code,
-            "set_material": self.set_material,
-            "get_polyhaven_status": self.get_polyhaven_status,
-        }
-        
-        # Add Polyhaven handlers only if enabled
-        if bpy.context.scene.blendermcp_use_polyhaven:
-            polyhaven_handlers = {
-                "get_polyhaven_categories": self.get_polyhaven_categories,
-                "search_polyhaven_assets": self.search_polyhaven_assets,
-                "download_polyhaven_asset": self.download_polyhaven_asset,
-                "set_texture": self.set_texture,
-            }
-            handlers.update(polyhaven_handlers)
-        
-        handler = handlers.get(cmd_type)
+        # Base handlers are always available; Polyhaven ones only if enabled
+        handler_name = self._BASE_HANDLERS.get(cmd_type)
+        if handler_name is None and bpy.context.scene.blendermcp_use_polyhaven:
+            handler_name = self._POLYHAVEN_HANDLERS.get(cmd_type)
+        handler = getattr(self, handler_name, None) if handler_name else None
         if handler:
             try:
-                print(f"Executing handler for {cmd_type}")
+                logger.debug("Executing handler for %s", cmd_type)
                 result = handler(**params)
-                print(f"Handler execution complete")
+                logger.debug("Handler execution complete")
                 return {"status": "success", "result": result}
             except Exception as e:
-                print(f"Error in handler: {str(e)}")
-                traceback.print_exc()
+                logger.error("Error in handler: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 return {"status": "error", "message": str(e)}
         else:
             return {"status": "error", "message": f"Unknown command type: {cmd_type}"}
 
+    def batch(self, commands):
+        """Run several commands in order for one request; each result has its own status"""
+        return {"results": [self.execute_command(command) for command in commands]}
     
     def get_simple_info(self):
         """Get basic Blender information"""
@@ -197,95 +807,130 @@ class BlenderMCPServer:
             "object_count": len(bpy.context.scene.objects)
         }
     
-    def get_scene_info(self):
+    def get_scene_info(self, include_counts=False):
         """Get information about the current Blender scene"""
         try:
-            print("Getting scene info...")
+            logger.debug("Getting scene info...")
             # Simplify the scene info to reduce data size
             scene_info = {
                 "name": bpy.context.scene.name,
-                "object_count": len(bpy.context.scene.objects),
                 "objects": [],
-                "materials_count": len(bpy.data.materials),
             }
+            # Totals cost a walk over the collections on big scenes; only pay when asked
+            if include_counts:
+                scene_info["object_count"] = len(bpy.context.scene.objects)
+                scene_info["materials_count"] = len(bpy.data.materials)
             
             # Collect minimal object information (limit to first 10 objects)
-            for i, obj in enumerate(bpy.context.scene.objects):
-                if i >= 10:  # Reduced from 20 to 10
-                    break
-                    
-                obj_info = {
+            objects = list(itertools.islice(bpy.context.scene.objects, 10))
+            
+            # Gather all locations into one array and round them in a single pass
+            locations = np.fromiter(
+                (component for obj in objects for component in obj.location),
+                dtype=np.float64,
+                count=3 * len(objects),
+            ).reshape(-1, 3)
+            np.round(locations, 2, out=locations)
+            
+            for obj, location in zip(objects, locations.tolist()):
+                scene_info["objects"].append({
                     "name": obj.name,
                     "type": obj.type,
                     # Only include basic location data
-                    "location": [round(float(obj.location.x), 2), 
-                                round(float(obj.location.y), 2), 
-                                round(float(obj.location.z), 2)],
-                }
-                scene_info["objects"].append(obj_info)
+                    "location": location,
+                })
             
-            print(f"Scene info collected: {len(scene_info['objects'])} objects")
+            logger.debug("Scene info collected: %s objects", len(scene_info['objects']))
             return scene_info
         except Exception as e:
-            print(f"Error in get_scene_info: {str(e)}")
-            traceback.print_exc()
+            logger.error("Error in get_scene_info: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"error": str(e)}
     
     def create_object(self, type="CUBE", name=None, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
                     align="WORLD", major_segments=48, minor_segments=12, mode="MAJOR_MINOR",
-                    major_radius=1.0, minor_radius=0.25, abso_major_rad=1.25, abso_minor_rad=0.75, generate_uvs=True):
-        """Create a new object in the scene"""
-        # Deselect all objects
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        if type == "CUBE":
-            bpy.ops.mesh.primitive_cube_add(location=location, rotation=rotation, scale=scale)
-        elif type == "SPHERE":
-            bpy.ops.mesh.primitive_uv_sphere_add(location=location, rotation=rotation, scale=scale)
-        elif type == "CYLINDER":
-            bpy.ops.mesh.primitive_cylinder_add(location=location, rotation=rotation, scale=scale)
-        elif type == "PLANE":
-            bpy.ops.mesh.primitive_plane_add(location=location, rotation=rotation, scale=scale)
-        elif type == "CONE":
-            bpy.ops.mesh.primitive_cone_add(location=location, rotation=rotation, scale=scale)
-        elif type == "TORUS":
-            bpy.ops.mesh.primitive_torus_add(
-                align=align,
-                location=location,
-                rotation=rotation,
-                major_segments=major_segments,
-                minor_segments=minor_segments,
-                mode=mode,
-                major_radius=major_radius,
-                minor_radius=minor_radius,
-                abso_major_rad=abso_major_rad,
-                abso_minor_rad=abso_minor_rad,
-                generate_uvs=generate_uvs
-            )
-        elif type == "EMPTY":
-            bpy.ops.object.empty_add(location=location, rotation=rotation, scale=scale)
-        elif type == "CAMERA":
-            bpy.ops.object.camera_add(location=location, rotation=rotation)
-        elif type == "LIGHT":
-            bpy.ops.object.light_add(type='POINT', location=location, rotation=rotation, scale=scale)
+                    major_radius=1.0, minor_radius=0.25, abso_major_rad=1.25, abso_minor_rad=0.75, generate_uvs=True,
+                    color=None, material_name=None):
+        """Create a new object in the scene, optionally with a material applied in the same command"""
+        primitive = _MESH_PRIMITIVES.get(type)
+        data_object = _DATA_OBJECTS.get(type)
+        if primitive:
+            obj = self._add_mesh_primitive(name, primitive, location, rotation, scale)
+        elif data_object:
+            default_name, new_data, applies_scale = data_object
+            obj = bpy.data.objects.new(name or default_name, new_data(name or default_name))
+            self._link_new_object(obj, location, rotation, scale if applies_scale else None)
         else:
-            raise ValueError(f"Unsupported object type: {type}")
-        
-        # Get the created object
-        obj = bpy.context.active_object
+            add_object = _OPERATOR_OBJECTS.get(type)
+            if add_object is None:
+                raise ValueError(f"Unsupported object type: {type}")
+            
+            # Deselect all objects
+            bpy.ops.object.select_all(action='DESELECT')
+            
+            torus_options = {
+                "align": align,
+                "major_segments": major_segments,
+                "minor_segments": minor_segments,
+                "mode": mode,
+                "major_radius": major_radius,
+                "minor_radius": minor_radius,
+                "abso_major_rad": abso_major_rad,
+                "abso_minor_rad": abso_minor_rad,
+                "generate_uvs": generate_uvs,
+            }
+            # Only the area needs overriding; temp_override keeps the rest of the context
+            with bpy.context.temp_override(area=self._get_view3d_area()):
+                add_object(location, rotation, scale, torus_options)
+            
+            # Get the created object
+            obj = bpy.context.active_object
         
         # Rename the object if a name is provided
         if name:
             obj.name = name
 
-        return {
+        result = {
             "name": obj.name,
             "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "location": _vec3(obj.location),
+            "rotation": _vec3(obj.rotation_euler),
+            "scale": _vec3(obj.scale),
         }
+        # Saves clients a separate set_material round trip
+        if color or material_name:
+            result["material"] = self.set_material(obj.name, material_name=material_name, color=color)
+        return result
+
+
+    def _add_mesh_primitive(self, name, primitive, location, rotation, scale):
+        """Build a mesh primitive through the data API instead of an operator"""
+        default_name, build = primitive
+        mesh = bpy.data.meshes.new(name or default_name)
+        bm = bmesh.new()
+        try:
+            bm.loops.layers.uv.new()
+            build(bm)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+        
+        obj = bpy.data.objects.new(name or default_name, mesh)
+        self._link_new_object(obj, location, rotation, scale)
+        return obj
 
+    def _link_new_object(self, obj, location, rotation, scale):
+        """Link a freshly created object into the scene the way the add operators do"""
+        bpy.context.collection.objects.link(obj)
+        obj.location = location
+        obj.rotation_euler = rotation
+        if scale is not None:
+            obj.scale = scale
+        
+        # Match the operators: the new object is the only selected one and active
+        for selected in bpy.context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
 
     def modify_object(self, name, location=None, rotation=None, scale=None, visible=None):
         """Modify an existing object in the scene"""
@@ -311,9 +956,9 @@ class BlenderMCPServer:
         return {
             "name": obj.name,
             "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "location": _vec3(obj.location),
+            "rotation": _vec3(obj.rotation_euler),
+            "scale": _vec3(obj.scale),
             "visible": obj.visible_get(),
         }
     
@@ -326,10 +971,8 @@ class BlenderMCPServer:
         # Store the name to return
         obj_name = obj.name
         
-        # Select and delete the object
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.ops.object.delete()
+        # Remove through the data API: no operator poll, undo push or context needed
+        bpy.data.objects.remove(obj, do_unlink=True)
         
         return {"deleted": obj_name}
     
@@ -343,18 +986,14 @@ class BlenderMCPServer:
         obj_info = {
             "name": obj.name,
             "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "location": _vec3(obj.location),
+            "rotation": _vec3(obj.rotation_euler),
+            "scale": _vec3(obj.scale),
             "visible": obj.visible_get(),
-            "materials": [],
+            # Read each slot's material once
+            "materials": [mat.name for mat in (slot.material for slot in obj.material_slots) if mat],
         }
         
-        # Add material slots
-        for slot in obj.material_slots:
-            if slot.material:
-                obj_info["materials"].append(slot.material.name)
-        
         # Add mesh data if applicable
         if obj.type == 'MESH' and obj.data:
             mesh = obj.data
@@ -371,8 +1010,8 @@ class BlenderMCPServer:
         # This is powerful but potentially dangerous - use with caution
         try:
             # Create a local namespace for execution
-            namespace = {"bpy": bpy}
-            exec(code, namespace)
+            namespace = dict(_EXEC_NAMESPACE)
+            exec(_compile_code(code), namespace)
             return {"executed": True}
         except Exception as e:
             raise Exception(f"Code execution error: {str(e)}")
@@ -394,7 +1033,7 @@ class BlenderMCPServer:
                 mat = bpy.data.materials.get(material_name)
                 if not mat and create_if_missing:
                     mat = bpy.data.materials.new(name=material_name)
-                    print(f"Created new material: {material_name}")
+                    logger.debug("Created new material: %s", material_name)
             else:
                 # Generate unique material name if none provided
                 mat_name = f"{object_name}_material"
@@ -402,7 +1041,7 @@ class BlenderMCPServer:
                 if not mat:
                     mat = bpy.data.materials.new(name=mat_name)
                 material_name = mat_name
-                print(f"Using material: {mat_name}")
+                logger.debug("Using material: %s", mat_name)
             
             # Set up material nodes if needed
             if mat:
@@ -429,7 +1068,7 @@ class BlenderMCPServer:
                         color[2],
                         1.0 if len(color) < 4 else color[3]
                     )
-                    print(f"Set material color to {color}")
+                    logger.debug("Set material color to %s", color)
             
             # Assign material to object if not already assigned
             if mat:
@@ -439,7 +1078,7 @@ class BlenderMCPServer:
                     # Only modify first material slot
                     obj.data.materials[0] = mat
                 
-                print(f"Assigned material {mat.name} to object {object_name}")
+                logger.debug("Assigned material %s to object %s", mat.name, object_name)
                 
                 return {
                     "status": "success",
@@ -451,8 +1090,7 @@ class BlenderMCPServer:
                 raise ValueError(f"Failed to create or find material: {material_name}")
             
         except Exception as e:
-            print(f"Error in set_material: {str(e)}")
-            traceback.print_exc()
+            logger.error("Error in set_material: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "status": "error",
                 "message": str(e),
@@ -486,9 +1124,9 @@ class BlenderMCPServer:
             if asset_type not in ["hdris", "textures", "models", "all"]:
                 return {"error": f"Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"}
                 
-            response = requests.get(f"https://api.polyhaven.com/categories/{asset_type}")
+            response = _HTTP.get(_POLYHAVEN_CATEGORIES_URL % asset_type, timeout=_HTTP_TIMEOUT)
             if response.status_code == 200:
-                return {"categories": response.json()}
+                return {"categories": _json_loads(response.content)}
             else:
                 return {"error": f"API request failed with status code {response.status_code}"}
         except Exception as e:
@@ -497,7 +1135,7 @@ class BlenderMCPServer:
     def search_polyhaven_assets(self, asset_type=None, categories=None):
         """Search for assets from Polyhaven with optional filtering"""
         try:
-            url = "https://api.polyhaven.com/assets"
+            url = _POLYHAVEN_ASSETS_URL
             params = {}
             
             if asset_type and asset_type != "all":
@@ -508,10 +1146,10 @@ class BlenderMCPServer:
             if categories:
                 params["categories"] = categories
                 
-            response = requests.get(url, params=params)
+            response = _HTTP.get(url, params=params, timeout=_HTTP_TIMEOUT)
             if response.status_code == 200:
                 # Limit the response size to avoid overwhelming Blender
-                assets = response.json()
+                assets = _json_loads(response.content)
                 # Return only the first 20 assets to keep response size manageable
                 limited_assets = {}
                 for i, (key, value) in enumerate(assets.items()):
@@ -526,13 +1164,37 @@ class BlenderMCPServer:
             return {"error": str(e)}
     
     def download_polyhaven_asset(self, asset_id, asset_type, resolution="1k", file_format=None):
+        """Start downloading a Polyhaven asset in the background.
+
+        The HTTP transfers run on the job worker so the UI stays responsive;
+        the import into Blender is finished on the main thread. The returned
+        job_id is polled with poll_job.
+        """
+        if asset_type not in ["hdris", "textures", "models"]:
+            return {"error": f"Unsupported asset type: {asset_type}"}
+        if not isinstance(resolution, str) or (file_format is not None and not isinstance(file_format, str)):
+            return {"error": "resolution and file_format must be strings"}
+        
+        # Polyhaven manifest keys are lower case ("2k", "exr")
+        resolution = resolution.lower()
+        file_format = file_format.lower() if file_format else None
+        
+        job_id = self._submit_job(
+            functools.partial(self._fetch_polyhaven_asset, asset_id, asset_type, resolution, file_format),
+            functools.partial(self._import_polyhaven_asset, asset_id, asset_type),
+        )
+        return {"job_id": job_id, "status": "running"}
+
+    def _fetch_polyhaven_asset(self, asset_id, asset_type, resolution, file_format):
+        """Download the files of an asset to disk. Runs on the job worker, so no bpy access"""
         try:
             # First get the files information
-            files_response = requests.get(f"https://api.polyhaven.com/files/{asset_id}")
+            files_response = _HTTP.get(_POLYHAVEN_FILES_URL % asset_id, timeout=_HTTP_TIMEOUT)
             if files_response.status_code != 200:
                 return {"error": f"Failed to get asset files: {files_response.status_code}"}
             
-            files_data = files_response.json()
+            # Decode with the fast codec and pick single entries by path
+            files_data = _json_loads(files_response.content)
             
             # Handle different asset types
             if asset_type == "hdris":
@@ -540,91 +1202,16 @@ class BlenderMCPServer:
                 if not file_format:
                     file_format = "hdr"  # Default format for HDRIs
                 
-                if "hdri" in files_data and resolution in files_data["hdri"] and file_format in files_data["hdri"][resolution]:
-                    file_info = files_data["hdri"][resolution][file_format]
+                file_info = _lookup(files_data, "hdri", resolution, file_format)
+                if file_info:
                     file_url = file_info["url"]
                     
                     # For HDRIs, we need to save to a temporary file first
                     # since Blender can't properly load HDR data directly from memory
-                    with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                        # Download the file
-                        response = requests.get(file_url)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download HDRI: {response.status_code}"}
-                        
-                        tmp_file.write(response.content)
-                        tmp_path = tmp_file.name
-                    
-                    try:
-                        # Create a new world if none exists
-                        if not bpy.data.worlds:
-                            bpy.data.worlds.new("World")
-                        
-                        world = bpy.data.worlds[0]
-                        world.use_nodes = True
-                        node_tree = world.node_tree
-                        
-                        # Clear existing nodes
-                        for node in node_tree.nodes:
-                            node_tree.nodes.remove(node)
-                        
-                        # Create nodes
-                        tex_coord = node_tree.nodes.new(type='ShaderNodeTexCoord')
-                        tex_coord.location = (-800, 0)
-                        
-                        mapping = node_tree.nodes.new(type='ShaderNodeMapping')
-                        mapping.location = (-600, 0)
-                        
-                        # Load the image from the temporary file
-                        env_tex = node_tree.nodes.new(type='ShaderNodeTexEnvironment')
-                        env_tex.location = (-400, 0)
-                        env_tex.image = bpy.data.images.load(tmp_path)
-                        
-                        # FIXED: Use a color space that exists in all Blender versions
-                        if file_format.lower() == 'exr':
-                            # Try to use Linear color space for EXR files
-                            try:
-                                env_tex.image.colorspace_settings.name = 'Linear'
-                            except:
-                                # Fallback to Non-Color if Linear isn't available
-                                env_tex.image.colorspace_settings.name = 'Non-Color'
-                        else:  # hdr
-                            # For HDR files, try these options in order
-                            for color_space in ['Linear', 'Linear Rec.709', 'Non-Color']:
-                                try:
-                                    env_tex.image.colorspace_settings.name = color_space
-                                    break  # Stop if we successfully set a color space
-                                except:
-                                    continue
-                        
-                        background = node_tree.nodes.new(type='ShaderNodeBackground')
-                        background.location = (-200, 0)
-                        
-                        output = node_tree.nodes.new(type='ShaderNodeOutputWorld')
-                        output.location = (0, 0)
-                        
-                        # Connect nodes
-                        node_tree.links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
-                        node_tree.links.new(mapping.outputs['Vector'], env_tex.inputs['Vector'])
-                        node_tree.links.new(env_tex.outputs['Color'], background.inputs['Color'])
-                        node_tree.links.new(background.outputs['Background'], output.inputs['Surface'])
-                        
-                        # Set as active world
-                        bpy.context.scene.world = world
-                        
-                        # Clean up temporary file
-                        try:
-                            tempfile._cleanup()  # This will clean up all temporary files
-                        except:
-                            pass
-                        
-                        return {
-                            "success": True, 
-                            "message": f"HDRI {asset_id} imported successfully",
-                            "image_name": env_tex.image.name
-                        }
-                    except Exception as e:
-                        return {"error": f"Failed to set up HDRI in Blender: {str(e)}"}
+                    tmp_path = _download_to_temp(file_url, f".{file_format}")
+                    if tmp_path is None:
+                        return {"error": "Failed to download HDRI"}
+                    return {"file_format": file_format, "tmp_path": tmp_path}
                 else:
                     return {"error": f"Requested resolution or format not available for this HDRI"}
                     
@@ -632,215 +1219,102 @@ class BlenderMCPServer:
                 if not file_format:
                     file_format = "jpg"  # Default format for textures
                 
-                downloaded_maps = {}
-                
                 try:
-                    for map_type in files_data:
+                    # Collect the URL of every map available in the requested resolution and format
+                    map_urls = {}
+                    for map_type, map_info in files_data.items():
                         if map_type not in ["blend", "gltf"]:  # Skip non-texture files
-                            if resolution in files_data[map_type] and file_format in files_data[map_type][resolution]:
-                                file_info = files_data[map_type][resolution][file_format]
-                                file_url = file_info["url"]
-                                
-                                # Use NamedTemporaryFile like we do for HDRIs
-                                with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                                    # Download the file
-                                    response = requests.get(file_url)
-                                    if response.status_code == 200:
-                                        tmp_file.write(response.content)
-                                        tmp_path = tmp_file.name
-                                        
-                                        # Load image from temporary file
-                                        image = bpy.data.images.load(tmp_path)
-                                        image.name = f"{asset_id}_{map_type}.{file_format}"
-                                        
-                                        # Pack the image into .blend file
-                                        image.pack()
-                                        
-                                        # Set color space based on map type
-                                        if map_type in ['color', 'diffuse', 'albedo']:
-                                            try:
-                                                image.colorspace_settings.name = 'sRGB'
-                                            except:
-                                                pass
-                                        else:
-                                            try:
-                                                image.colorspace_settings.name = 'Non-Color'
-                                            except:
-                                                pass
-                                        
-                                        downloaded_maps[map_type] = image
-                                        
-                                        # Clean up temporary file
-                                        try:
-                                            os.unlink(tmp_path)
-                                        except:
-                                            pass
-                
-                    if not downloaded_maps:
-                        return {"error": f"No texture maps found for the requested resolution and format"}
-                    
-                    # Create a new material with the downloaded textures
-                    mat = bpy.data.materials.new(name=asset_id)
-                    mat.use_nodes = True
-                    nodes = mat.node_tree.nodes
-                    links = mat.node_tree.links
-                    
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-                    
-                    # Create output node
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    output.location = (300, 0)
+                            file_url = _lookup(map_info, resolution, file_format, "url")
+                            if file_url:
+                                map_urls[map_type] = file_url
                     
-                    # Create principled BSDF node
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-                    principled.location = (0, 0)
-                    links.new(principled.outputs[0], output.inputs[0])
-                    
-                    # Add texture nodes based on available maps
-                    tex_coord = nodes.new(type='ShaderNodeTexCoord')
-                    tex_coord.location = (-800, 0)
-                    
-                    mapping = nodes.new(type='ShaderNodeMapping')
-                    mapping.location = (-600, 0)
-                    mapping.vector_type = 'TEXTURE'  # Changed from default 'POINT' to 'TEXTURE'
-                    links.new(tex_coord.outputs['UV'], mapping.inputs['Vector'])
-                    
-                    # Position offset for texture nodes
-                    x_pos = -400
-                    y_pos = 300
+                    # Download all maps concurrently
+                    futures = {
+                        map_type: _DOWNLOAD_POOL.submit(_download_to_temp, file_url, f".{file_format}")
+                        for map_type, file_url in map_urls.items()
+                    }
+                    wait(futures.values())
                     
-                    # Connect different texture maps
-                    for map_type, image in downloaded_maps.items():
-                        tex_node = nodes.new(type='ShaderNodeTexImage')
-                        tex_node.location = (x_pos, y_pos)
-                        tex_node.image = image
-                        
-                        # Set color space based on map type
-                        if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                            try:
-                                tex_node.image.colorspace_settings.name = 'sRGB'
-                            except:
-                                pass  # Use default if sRGB not available
-                        else:
+                    map_paths = {}
+                    errors = []
+                    for map_type, future in futures.items():
+                        try:
+                            tmp_path = future.result()
+                        except Exception as e:
+                            errors.append(f"{map_type}: {str(e)}")
+                            continue
+                        if tmp_path:
+                            map_paths[map_type] = tmp_path
+                    if errors:
+                        # The maps that did download will never be used
+                        for tmp_path in map_paths.values():
                             try:
-                                tex_node.image.colorspace_settings.name = 'Non-Color'
-                            except:
-                                pass  # Use default if Non-Color not available
-                        
-                        links.new(mapping.outputs['Vector'], tex_node.inputs['Vector'])
-                        
-                        # Connect to appropriate input on Principled BSDF
-                        if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                            links.new(tex_node.outputs['Color'], principled.inputs['Base Color'])
-                        elif map_type.lower() in ['roughness', 'rough']:
-                            links.new(tex_node.outputs['Color'], principled.inputs['Roughness'])
-                        elif map_type.lower() in ['metallic', 'metalness', 'metal']:
-                            links.new(tex_node.outputs['Color'], principled.inputs['Metallic'])
-                        elif map_type.lower() in ['normal', 'nor']:
-                            # Add normal map node
-                            normal_map = nodes.new(type='ShaderNodeNormalMap')
-                            normal_map.location = (x_pos + 200, y_pos)
-                            links.new(tex_node.outputs['Color'], normal_map.inputs['Color'])
-                            links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
-                        elif map_type in ['displacement', 'disp', 'height']:
-                            # Add displacement node
-                            disp_node = nodes.new(type='ShaderNodeDisplacement')
-                            disp_node.location = (x_pos + 200, y_pos - 200)
-                            links.new(tex_node.outputs['Color'], disp_node.inputs['Height'])
-                            links.new(disp_node.outputs['Displacement'], output.inputs['Displacement'])
-                        
-                        y_pos -= 250
-                    
-                    return {
-                        "success": True, 
-                        "message": f"Texture {asset_id} imported as material",
-                        "material": mat.name,
-                        "maps": list(downloaded_maps.keys())
-                    }
-                
+                                os.unlink(tmp_path)
+                            except OSError:
+                                pass
+                        return {"error": f"Failed to process textures: {'; '.join(errors)}"}
                 except Exception as e:
                     return {"error": f"Failed to process textures: {str(e)}"}
                 
+                if not map_paths:
+                    return {"error": f"No texture maps found for the requested resolution and format"}
+                
+                return {"file_format": file_format, "map_paths": map_paths}
+                
             elif asset_type == "models":
-                # For models, prefer glTF format if available
+                # Without a requested format, take the most preferred one on offer
                 if not file_format:
-                    file_format = "gltf"  # Default format for models
+                    file_format = next(
+                        (fmt for fmt in _MODEL_FORMAT_PREFERENCE if _lookup(files_data, fmt, resolution, fmt)),
+                        "gltf",
+                    )
                 
-                if file_format in files_data and resolution in files_data[file_format]:
-                    file_info = files_data[file_format][resolution][file_format]
+                file_info = _lookup(files_data, file_format, resolution, file_format)
+                if file_info:
                     file_url = file_info["url"]
                     
                     # Create a temporary directory to store the model and its dependencies
-                    temp_dir = tempfile.mkdtemp()
-                    main_file_path = ""
+                    temp_dir = tempfile.mkdtemp(prefix=_MODEL_DIR_PREFIX, dir=_scratch_dir())
+                    fetched = None
                     
                     try:
                         # Download the main model file
                         main_file_name = file_url.split("/")[-1]
                         main_file_path = os.path.join(temp_dir, main_file_name)
                         
-                        response = requests.get(file_url)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download model: {response.status_code}"}
-                        
-                        with open(main_file_path, "wb") as f:
-                            f.write(response.content)
+                        includes = file_info.get("include") or {}
+                        # Create each include directory once, up front, rather than per file
+                        for include_dir in {os.path.dirname(os.path.join(temp_dir, p)) for p in includes}:
+                            os.makedirs(include_dir, exist_ok=True)
                         
-                        # Check for included files and download them
-                        if "include" in file_info and file_info["include"]:
-                            for include_path, include_info in file_info["include"].items():
-                                # Get the URL for the included file - this is the fix
-                                include_url = include_info["url"]
-                                
-                                # Create the directory structure for the included file
-                                include_file_path = os.path.join(temp_dir, include_path)
-                                os.makedirs(os.path.dirname(include_file_path), exist_ok=True)
-                                
-                                # Download the included file
-                                include_response = requests.get(include_url)
-                                if include_response.status_code == 200:
-                                    with open(include_file_path, "wb") as f:
-                                        f.write(include_response.content)
-                                else:
-                                    print(f"Failed to download included file: {include_path}")
+                        # Fetch the main file and every included file (buffers, textures) concurrently;
+                        # the main file is submitted first so it is never queued behind includes
+                        main_future = _DOWNLOAD_POOL.submit(_download_to_path, file_url, main_file_path)
+                        include_futures = {
+                            include_path: _DOWNLOAD_POOL.submit(
+                                _download_to_path, include_info["url"], os.path.join(temp_dir, include_path)
+                            )
+                            for include_path, include_info in includes.items()
+                        }
+                        # Let every transfer settle before the directory can be cleaned up
+                        wait([main_future, *include_futures.values()])
                         
-                        # Import the model into Blender
-                        if file_format == "gltf" or file_format == "glb":
-                            bpy.ops.import_scene.gltf(filepath=main_file_path)
-                        elif file_format == "fbx":
-                            bpy.ops.import_scene.fbx(filepath=main_file_path)
-                        elif file_format == "obj":
-                            bpy.ops.import_scene.obj(filepath=main_file_path)
-                        elif file_format == "blend":
-                            # For blend files, we need to append or link
-                            with bpy.data.libraries.load(main_file_path, link=False) as (data_from, data_to):
-                                data_to.objects = data_from.objects
-                            
-                            # Link the objects to the scene
-                            for obj in data_to.objects:
-                                if obj is not None:
-                                    bpy.context.collection.objects.link(obj)
-                        else:
-                            return {"error": f"Unsupported model format: {file_format}"}
+                        status = main_future.result()
+                        if status != 200:
+                            return {"error": f"Failed to download model: {status}"}
                         
-                        # Get the names of imported objects
-                        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+                        for include_path, future in include_futures.items():
+                            if future.result() != 200:
+                                logger.warning("Failed to download included file: %s", include_path)
                         
-                        return {
-                            "success": True, 
-                            "message": f"Model {asset_id} imported successfully",
-                            "imported_objects": imported_objects
-                        }
+                        fetched = {"file_format": file_format, "temp_dir": temp_dir, "main_file_path": main_file_path}
+                        return fetched
                     except Exception as e:
-                        return {"error": f"Failed to import model: {str(e)}"}
+                        return {"error": f"Failed to download model: {str(e)}"}
                     finally:
-                        # Clean up temporary directory
-                        try:
-                            shutil.rmtree(temp_dir)
-                        except:
-                            print(f"Failed to clean up temporary directory: {temp_dir}")
+                        # The import step owns the directory once everything is downloaded
+                        if fetched is None:
+                            shutil.rmtree(temp_dir, ignore_errors=True)
                 else:
                     return {"error": f"Requested format or resolution not available for this model"}
                 
@@ -850,261 +1324,363 @@ class BlenderMCPServer:
         except Exception as e:
             return {"error": f"Failed to download asset: {str(e)}"}
 
-    def set_texture(self, object_name, texture_id):
-        """Apply a previously downloaded Polyhaven texture to an object by creating a new material"""
-        try:
-            # Get the object
-            obj = bpy.data.objects.get(object_name)
-            if not obj:
-                return {"error": f"Object not found: {object_name}"}
-            
-            # Make sure object can accept materials
-            if not hasattr(obj, 'data') or not hasattr(obj.data, 'materials'):
-                return {"error": f"Object {object_name} cannot accept materials"}
-            
-            # Find all images related to this texture and ensure they're properly loaded
-            texture_images = {}
-            for img in bpy.data.images:
-                if img.name.startswith(texture_id + "_"):
-                    # Extract the map type from the image name
-                    map_type = img.name.split('_')[-1].split('.')[0]
-                    
-                    # Force a reload of the image
-                    img.reload()
-                    
-                    # Ensure proper color space
-                    if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                        try:
-                            img.colorspace_settings.name = 'sRGB'
-                        except:
-                            pass
-                    else:
-                        try:
-                            img.colorspace_settings.name = 'Non-Color'
-                        except:
-                            pass
-                    
-                    # Ensure the image is packed
-                    if not img.packed_file:
-                        img.pack()
-                    
-                    texture_images[map_type] = img
-                    print(f"Loaded texture map: {map_type} - {img.name}")
-                    
-                    # Debug info
-                    print(f"Image size: {img.size[0]}x{img.size[1]}")
-                    print(f"Color space: {img.colorspace_settings.name}")
-                    print(f"File format: {img.file_format}")
-                    print(f"Is packed: {bool(img.packed_file)}")
+    def _import_polyhaven_asset(self, asset_id, asset_type, fetched):
+        """Import downloaded asset files into Blender on the main thread"""
+        if "error" in fetched:
+            return fetched
+        if asset_type == "hdris":
+            return self._import_polyhaven_hdri(asset_id, **fetched)
+        elif asset_type == "textures":
+            return self._import_polyhaven_textures(asset_id, **fetched)
+        else:
+            return self._import_polyhaven_model(asset_id, **fetched)
 
-            if not texture_images:
-                return {"error": f"No texture images found for: {texture_id}. Please download the texture first."}
-            
-            # Create a new material
-            new_mat_name = f"{texture_id}_material_{object_name}"
-            
-            # Remove any existing material with this name to avoid conflicts
-            existing_mat = bpy.data.materials.get(new_mat_name)
-            if existing_mat:
-                bpy.data.materials.remove(existing_mat)
-            
-            new_mat = bpy.data.materials.new(name=new_mat_name)
-            new_mat.use_nodes = True
-            
-            # Set up the material nodes
-            nodes = new_mat.node_tree.nodes
-            links = new_mat.node_tree.links
-            
-            # Clear default nodes
-            nodes.clear()
-            
-            # Create output node
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            output.location = (600, 0)
-            
-            # Create principled BSDF node
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-            principled.location = (300, 0)
-            links.new(principled.outputs[0], output.inputs[0])
+    def _get_hdri_world(self):
+        """Return the world used for Polyhaven HDRIs, building its node graph only once"""
+        world = bpy.data.worlds.get(_HDRI_WORLD_NAME)
+        if world and world.node_tree and _HDRI_ENV_NODE in world.node_tree.nodes:
+            return world
+        
+        if not world:
+            world = bpy.data.worlds.new(_HDRI_WORLD_NAME)
+        world.use_nodes = True
+        node_tree = world.node_tree
+        
+        # Clear existing nodes
+        for node in node_tree.nodes:
+            node_tree.nodes.remove(node)
+        
+        # Create nodes
+        tex_coord = node_tree.nodes.new(type='ShaderNodeTexCoord')
+        tex_coord.location = (-800, 0)
+        
+        mapping = node_tree.nodes.new(type='ShaderNodeMapping')
+        mapping.location = (-600, 0)
+        
+        env_tex = node_tree.nodes.new(type='ShaderNodeTexEnvironment')
+        env_tex.name = _HDRI_ENV_NODE
+        env_tex.location = (-400, 0)
+        
+        background = node_tree.nodes.new(type='ShaderNodeBackground')
+        background.location = (-200, 0)
+        
+        output = node_tree.nodes.new(type='ShaderNodeOutputWorld')
+        output.location = (0, 0)
+        
+        # Connect nodes
+        node_tree.links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
+        node_tree.links.new(mapping.outputs['Vector'], env_tex.inputs['Vector'])
+        node_tree.links.new(env_tex.outputs['Color'], background.inputs['Color'])
+        node_tree.links.new(background.outputs['Background'], output.inputs['Surface'])
+        return world
+
+    def _import_polyhaven_hdri(self, asset_id, file_format, tmp_path):
+        """Set a downloaded HDRI as the world environment"""
+        try:
+            # Later HDRIs only swap the image in the existing node graph
+            world = self._get_hdri_world()
+            env_tex = world.node_tree.nodes[_HDRI_ENV_NODE]
             
-            # Add texture nodes based on available maps
-            tex_coord = nodes.new(type='ShaderNodeTexCoord')
-            tex_coord.location = (-800, 0)
+            # Load the image from the temporary file
+            env_tex.image = bpy.data.images.load(tmp_path, check_existing=True)
+            # Pack it so the temporary file can be removed
+            env_tex.image.pack()
             
-            mapping = nodes.new(type='ShaderNodeMapping')
-            mapping.location = (-600, 0)
-            mapping.vector_type = 'TEXTURE'  # Changed from default 'POINT' to 'TEXTURE'
-            links.new(tex_coord.outputs['UV'], mapping.inputs['Vector'])
+            # HDR and EXR data is linear; the supported name is probed once per session
+            _set_linear_colorspace(env_tex.image)
             
-            # Position offset for texture nodes
-            x_pos = -400
-            y_pos = 300
+            # Set as active world
+            bpy.context.scene.world = world
             
-            # Connect different texture maps
-            for map_type, image in texture_images.items():
-                tex_node = nodes.new(type='ShaderNodeTexImage')
-                tex_node.location = (x_pos, y_pos)
-                tex_node.image = image
+            return {
+                "success": True, 
+                "message": f"HDRI {asset_id} imported successfully",
+                "image_name": env_tex.image.name
+            }
+        except Exception as e:
+            return {"error": f"Failed to set up HDRI in Blender: {str(e)}"}
+        finally:
+            # Remove only the file this download created
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _import_polyhaven_textures(self, asset_id, file_format, map_paths):
+        """Load downloaded texture maps and build a material from them"""
+        downloaded_maps = {}
+        
+        try:
+            for map_type, tmp_path in map_paths.items():
+                # Refill an image from an earlier download instead of adding a "*.001" duplicate
+                image_name = f"{asset_id}_{map_type}.{file_format}"
+                image = bpy.data.images.get(image_name)
+                if image:
+                    if image.packed_file:
+                        image.unpack(method='REMOVE')
+                    image.filepath = tmp_path
+                    image.reload()
+                else:
+                    image = bpy.data.images.load(tmp_path, check_existing=True)
+                    image.name = image_name
+                map_type = map_type.lower()
+                
+                # Pack the image into .blend file
+                image.pack()
                 
                 # Set color space based on map type
-                if map_type.lower() in ['color', 'diffuse', 'albedo']:
+                if _MAP_ALIAS.get(map_type) == 'color':
                     try:
-                        tex_node.image.colorspace_settings.name = 'sRGB'
+                        image.colorspace_settings.name = 'sRGB'
                     except:
-                        pass  # Use default if sRGB not available
+                        pass
                 else:
                     try:
-                        tex_node.image.colorspace_settings.name = 'Non-Color'
+                        image.colorspace_settings.name = 'Non-Color'
                     except:
-                        pass  # Use default if Non-Color not available
-                
-                links.new(mapping.outputs['Vector'], tex_node.inputs['Vector'])
+                        pass
                 
-                # Connect to appropriate input on Principled BSDF
-                if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Base Color'])
-                elif map_type.lower() in ['roughness', 'rough']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Roughness'])
-                elif map_type.lower() in ['metallic', 'metalness', 'metal']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Metallic'])
-                elif map_type.lower() in ['normal', 'nor', 'dx', 'gl']:
-                    # Add normal map node
-                    normal_map = nodes.new(type='ShaderNodeNormalMap')
-                    normal_map.location = (x_pos + 200, y_pos)
-                    links.new(tex_node.outputs['Color'], normal_map.inputs['Color'])
-                    links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
-                elif map_type.lower() in ['displacement', 'disp', 'height']:
-                    # Add displacement node
-                    disp_node = nodes.new(type='ShaderNodeDisplacement')
-                    disp_node.location = (x_pos + 200, y_pos - 200)
-                    disp_node.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
-                    links.new(tex_node.outputs['Color'], disp_node.inputs['Height'])
-                    links.new(disp_node.outputs['Displacement'], output.inputs['Displacement'])
-                
-                y_pos -= 250
-            
-            # Second pass: Connect nodes with proper handling for special cases
-            texture_nodes = {}
+                downloaded_maps[map_type] = image
             
-            # First find all texture nodes and store them by map type
-            for node in nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    for map_type, image in texture_images.items():
-                        if node.image == image:
-                            texture_nodes[map_type] = node
-                            break
+            # Create a new material with the downloaded textures
+            mat = self._build_principled_material(asset_id, downloaded_maps)
             
-            # Now connect everything using the nodes instead of images
-            # Handle base color (diffuse)
-            for map_name in ['color', 'diffuse', 'albedo']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Base Color'])
-                    print(f"Connected {map_name} to Base Color")
-                    break
-            
-            # Handle roughness
-            for map_name in ['roughness', 'rough']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Roughness'])
-                    print(f"Connected {map_name} to Roughness")
-                    break
+            return {
+                "success": True, 
+                "message": f"Texture {asset_id} imported as material",
+                "material": mat.name,
+                "maps": list(downloaded_maps.keys())
+            }
+        
+        except Exception as e:
+            return {"error": f"Failed to process textures: {str(e)}"}
+        finally:
+            # The images are packed, so the downloaded files are no longer needed
+            for tmp_path in map_paths.values():
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _import_polyhaven_model(self, asset_id, file_format, temp_dir, main_file_path):
+        """Import a downloaded model and remove its temporary directory"""
+        try:
+            # Import the model into Blender
+            importer = _MODEL_IMPORTERS.get(file_format)
+            if importer:
+                importer(main_file_path)
+            elif file_format == "blend":
+                # For blend files, we need to append or link
+                with bpy.data.libraries.load(main_file_path, link=False) as (data_from, data_to):
+                    data_to.objects = data_from.objects
+                
+                # Link the objects to the scene
+                for obj in data_to.objects:
+                    if obj is not None:
+                        bpy.context.collection.objects.link(obj)
+            else:
+                return {"error": f"Unsupported model format: {file_format}"}
             
-            # Handle metallic
-            for map_name in ['metallic', 'metalness', 'metal']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Metallic'])
-                    print(f"Connected {map_name} to Metallic")
-                    break
+            # Get the names of imported objects
+            imported_objects = [obj.name for obj in bpy.context.selected_objects]
             
-            # Handle normal maps
-            for map_name in ['gl', 'dx', 'nor']:
-                if map_name in texture_nodes:
-                    normal_map_node = nodes.new(type='ShaderNodeNormalMap')
-                    normal_map_node.location = (100, 100)
-                    links.new(texture_nodes[map_name].outputs['Color'], normal_map_node.inputs['Color'])
-                    links.new(normal_map_node.outputs['Normal'], principled.inputs['Normal'])
-                    print(f"Connected {map_name} to Normal")
-                    break
+            return {
+                "success": True, 
+                "message": f"Model {asset_id} imported successfully",
+                "imported_objects": imported_objects
+            }
+        except Exception as e:
+            return {"error": f"Failed to import model: {str(e)}"}
+        finally:
+            # Clean up temporary directory; leftovers are swept by a later session
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if os.path.exists(temp_dir):
+                logger.warning("Failed to clean up temporary directory: %s", temp_dir)
+
+    def _build_principled_material(self, name, texture_images):
+        """Create a material wiring texture maps (lower-case map type -> image) into a Principled BSDF"""
+        mat = bpy.data.materials.new(name=name)
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        nodes.clear()
+        
+        # Create every node first, then link them in one go (texture inputs excepted)
+        output = nodes.new(type='ShaderNodeOutputMaterial')
+        output.location = (600, 0)
+        principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+        principled.location = (300, 0)
+        tex_coord = nodes.new(type='ShaderNodeTexCoord')
+        tex_coord.location = (-800, 0)
+        mapping = nodes.new(type='ShaderNodeMapping')
+        mapping.location = (-600, 0)
+        mapping.vector_type = 'TEXTURE'  # Changed from default 'POINT' to 'TEXTURE'
+        mapping_out = mapping.outputs['Vector']
+        
+        # Texture nodes stack downwards in one column
+        positions = [(-400, 300 - 250 * i) for i in range(len(texture_images))]
+        texture_nodes = {}
+        texture_info = {}  # Node name -> summary reported back by set_texture
+        for (map_type, image), position in zip(texture_images.items(), positions):
+            tex_node = nodes.new(type='ShaderNodeTexImage')
+            tex_node.location = position
+            tex_node.image = image
+            # Linked here so maps that share a canonical type with an earlier one are mapped too
+            links.new(mapping_out, tex_node.inputs['Vector'])
+            texture_info[tex_node.name] = {
+                "name": tex_node.name,
+                "image": image.name,
+                "colorspace": image.colorspace_settings.name,
+                "connections": [],
+            }
+            # Keyed like set_texture's image names ("nor_gl" -> "gl"), then by canonical map
+            key = map_type.split('_')[-1]
+            texture_nodes.setdefault(_MAP_ALIAS.get(key, key), tex_node)
+        
+        base_color_tex = texture_nodes.get('color')
+        roughness_tex = texture_nodes.get('roughness')
+        metallic_tex = texture_nodes.get('metallic')
+        normal_tex = texture_nodes.get('normal')
+        displacement_tex = texture_nodes.get('displacement')
+        
+        normal_map = None
+        if normal_tex:
+            normal_map = nodes.new(type='ShaderNodeNormalMap')
+            normal_map.location = (100, 100)
+        
+        displacement = None
+        if displacement_tex:
+            displacement = nodes.new(type='ShaderNodeDisplacement')
+            displacement.location = (300, -200)
+            displacement.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
+        
+        # ARM packs Ambient Occlusion, Roughness and Metallic into R, G and B
+        separate_rgb = None
+        if 'arm' in texture_nodes:
+            separate_rgb = nodes.new(type='ShaderNodeSeparateRGB')
+            separate_rgb.location = (-200, -100)
+        
+        # AO (a dedicated map, else ARM's R channel) is multiplied into the base color
+        if 'ao' in texture_nodes:
+            ao_output = texture_nodes['ao'].outputs['Color']
+        elif separate_rgb:
+            ao_output = separate_rgb.outputs['R']
+        else:
+            ao_output = None
+        
+        mix_node = None
+        if base_color_tex and ao_output:
+            mix_node = nodes.new(type='ShaderNodeMixRGB')
+            mix_node.location = (100, 200)
+            mix_node.blend_type = 'MULTIPLY'
+            mix_node.inputs['Fac'].default_value = 0.8  # 80% influence
+        
+        # Resolve each socket by name once
+        base_color_in = principled.inputs['Base Color']
+        roughness_in = principled.inputs['Roughness']
+        metallic_in = principled.inputs['Metallic']
+        normal_in = principled.inputs['Normal']
+        displacement_in = output.inputs['Displacement']
+        
+        def link(from_socket, to_socket):
+            links.new(from_socket, to_socket)
+            info = texture_info.get(from_socket.node.name)
+            if info:
+                info["connections"].append(f"{from_socket.name} → {to_socket.node.name}.{to_socket.name}")
+        
+        link(principled.outputs[0], output.inputs[0])
+        link(tex_coord.outputs['UV'], mapping.inputs['Vector'])
+        if separate_rgb:
+            link(texture_nodes['arm'].outputs['Color'], separate_rgb.inputs['Image'])
+        
+        if mix_node:
+            link(base_color_tex.outputs['Color'], mix_node.inputs[1])
+            link(ao_output, mix_node.inputs[2])
+            link(mix_node.outputs['Color'], base_color_in)
+        elif base_color_tex:
+            link(base_color_tex.outputs['Color'], base_color_in)
+        
+        # Dedicated roughness/metallic maps take precedence over the ARM channels
+        if roughness_tex:
+            link(roughness_tex.outputs['Color'], roughness_in)
+        elif separate_rgb:
+            link(separate_rgb.outputs['G'], roughness_in)
+        
+        if metallic_tex:
+            link(metallic_tex.outputs['Color'], metallic_in)
+        elif separate_rgb:
+            link(separate_rgb.outputs['B'], metallic_in)
+        
+        if normal_map:
+            link(normal_tex.outputs['Color'], normal_map.inputs['Color'])
+            link(normal_map.outputs['Normal'], normal_in)
+        
+        if displacement:
+            link(displacement_tex.outputs['Color'], displacement.inputs['Height'])
+            link(displacement.outputs['Displacement'], displacement_in)
+        
+        # Kept on the material so reuses can report it without walking the node tree
+        mat["bmcp_texture_nodes"] = json.dumps(list(texture_info.values()))
+        logger.debug("Built material %s from maps: %s", mat.name, list(texture_nodes))
+        return mat
+
+    def set_texture(self, object_name, texture_id):
+        """Apply a previously downloaded Polyhaven texture to an object by creating a new material"""
+        try:
+            # Get the object
+            obj = bpy.data.objects.get(object_name)
+            if not obj:
+                return {"error": f"Object not found: {object_name}"}
             
-            # Handle displacement
-            for map_name in ['displacement', 'disp', 'height']:
-                if map_name in texture_nodes:
-                    disp_node = nodes.new(type='ShaderNodeDisplacement')
-                    disp_node.location = (300, -200)
-                    disp_node.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
-                    links.new(texture_nodes[map_name].outputs['Color'], disp_node.inputs['Height'])
-                    links.new(disp_node.outputs['Displacement'], output.inputs['Displacement'])
-                    print(f"Connected {map_name} to Displacement")
-                    break
+            # Make sure object can accept materials
+            if not hasattr(obj, 'data') or not hasattr(obj.data, 'materials'):
+                return {"error": f"Object {object_name} cannot accept materials"}
             
-            # Handle ARM texture (Ambient Occlusion, Roughness, Metallic)
-            if 'arm' in texture_nodes:
-                separate_rgb = nodes.new(type='ShaderNodeSeparateRGB')
-                separate_rgb.location = (-200, -100)
-                links.new(texture_nodes['arm'].outputs['Color'], separate_rgb.inputs['Image'])
+            # Find all images related to this texture and ensure they're properly loaded
+            prefix = texture_id + "_"
+            texture_images = {}
+            candidates = [img for img in bpy.data.images if img.name.startswith(prefix)]
+            for img in candidates:
+                # Extract the map type; split on the first dot so Blender's ".001" duplicates parse too
+                map_type = img.name[len(prefix):].split('.')[0].split('_')[-1].lower()
                 
-                # Connect Roughness (G) if no dedicated roughness map
-                if not any(map_name in texture_nodes for map_name in ['roughness', 'rough']):
-                    links.new(separate_rgb.outputs['G'], principled.inputs['Roughness'])
-                    print("Connected ARM.G to Roughness")
+                # Reload only images whose pixels are not in memory yet
+                if not img.has_data:
+                    img.reload()
                 
-                # Connect Metallic (B) if no dedicated metallic map
-                if not any(map_name in texture_nodes for map_name in ['metallic', 'metalness', 'metal']):
-                    links.new(separate_rgb.outputs['B'], principled.inputs['Metallic'])
-                    print("Connected ARM.B to Metallic")
+                # Ensure proper color space
+                if _MAP_ALIAS.get(map_type) == 'color':
+                    try:
+                        img.colorspace_settings.name = 'sRGB'
+                    except:
+                        pass
+                else:
+                    try:
+                        img.colorspace_settings.name = 'Non-Color'
+                    except:
+                        pass
                 
-                # For AO (R channel), multiply with base color if we have one
-                base_color_node = None
-                for map_name in ['color', 'diffuse', 'albedo']:
-                    if map_name in texture_nodes:
-                        base_color_node = texture_nodes[map_name]
-                        break
+                # Pack only images whose backing file has gone away (e.g. a removed temp file)
+                if (img.source == 'FILE' and not img.packed_file
+                        and not os.path.exists(bpy.path.abspath(img.filepath))):
+                    img.pack()
                 
-                if base_color_node:
-                    mix_node = nodes.new(type='ShaderNodeMixRGB')
-                    mix_node.location = (100, 200)
-                    mix_node.blend_type = 'MULTIPLY'
-                    mix_node.inputs['Fac'].default_value = 0.8  # 80% influence
-                    
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs['Color'].links:
-                        if link.to_socket == principled.inputs['Base Color']:
-                            links.remove(link)
-                    
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs['Color'], mix_node.inputs[1])
-                    links.new(separate_rgb.outputs['R'], mix_node.inputs[2])
-                    links.new(mix_node.outputs['Color'], principled.inputs['Base Color'])
-                    print("Connected ARM.R to AO mix with Base Color")
+                texture_images[map_type] = img
+                logger.debug("Loaded texture map: %s - %s", map_type, img.name)
+
+            if not texture_images:
+                return {"error": f"No texture images found for: {texture_id}. Please download the texture first."}
             
-            # Handle AO (Ambient Occlusion) if separate
-            if 'ao' in texture_nodes:
-                base_color_node = None
-                for map_name in ['color', 'diffuse', 'albedo']:
-                    if map_name in texture_nodes:
-                        base_color_node = texture_nodes[map_name]
-                        break
-                
-                if base_color_node:
-                    mix_node = nodes.new(type='ShaderNodeMixRGB')
-                    mix_node.location = (100, 200)
-                    mix_node.blend_type = 'MULTIPLY'
-                    mix_node.inputs['Fac'].default_value = 0.8  # 80% influence
-                    
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs['Color'].links:
-                        if link.to_socket == principled.inputs['Base Color']:
-                            links.remove(link)
-                    
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs['Color'], mix_node.inputs[1])
-                    links.new(texture_nodes['ao'].outputs['Color'], mix_node.inputs[2])
-                    links.new(mix_node.outputs['Color'], principled.inputs['Base Color'])
-                    print("Connected AO to mix with Base Color")
+            # Objects using the same texture set share one material (and one shader)
+            signature = f"{texture_id}|{','.join(sorted(texture_images))}"
+            new_mat = next((m for m in bpy.data.materials if m.get("bmcp_sig") == signature), None)
+            reused = new_mat is not None
+            if not reused:
+                new_mat = self._build_principled_material(f"{texture_id}_material", texture_images)
+                new_mat["bmcp_sig"] = signature
             
             # CRITICAL: Make sure to clear all existing materials from the object
-            while len(obj.data.materials) > 0:
-                obj.data.materials.pop(index=0)
+            obj.data.materials.clear()
             
             # Assign the new material to the object
             obj.data.materials.append(new_mat)
@@ -1113,9 +1689,6 @@ class BlenderMCPServer:
             bpy.context.view_layer.objects.active = obj
             obj.select_set(True)
             
-            # CRITICAL: Force Blender to update the material
-            bpy.context.view_layer.update()
-            
             # Get the list of texture maps
             texture_maps = list(texture_images.keys())
             
@@ -1124,34 +1697,19 @@ class BlenderMCPServer:
                 "name": new_mat.name,
                 "has_nodes": new_mat.use_nodes,
                 "node_count": len(new_mat.node_tree.nodes),
-                "texture_nodes": []
+                "texture_nodes": json.loads(new_mat.get("bmcp_texture_nodes", "[]"))
             }
             
-            for node in new_mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    connections = []
-                    for output in node.outputs:
-                        for link in output.links:
-                            connections.append(f"{output.name} → {link.to_node.name}.{link.to_socket.name}")
-                    
-                    material_info["texture_nodes"].append({
-                        "name": node.name,
-                        "image": node.image.name,
-                        "colorspace": node.image.colorspace_settings.name,
-                        "connections": connections
-                    })
-            
             return {
                 "success": True,
-                "message": f"Created new material and applied texture {texture_id} to {object_name}",
+                "message": f"{'Reused' if reused else 'Created new'} material and applied texture {texture_id} to {object_name}",
                 "material": new_mat.name,
                 "maps": texture_maps,
                 "material_info": material_info
             }
             
         except Exception as e:
-            print(f"Error in set_texture: {str(e)}")
-            traceback.print_exc()
+            logger.error("Error in set_texture: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"error": f"Failed to apply texture: {str(e)}"}
 
     def get_polyhaven_status(self):
@@ -3,4 +3,4 @@
 __version__ = "0.1.0"
 
 # Expose key classes and functions for easier imports
-from .server import BlenderConnection, get_blender_connection
+from .server import BlenderConnection, BlenderConnectionPool
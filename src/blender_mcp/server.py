@@ -1,39 +1,196 @@
 # blender_mcp_server.py
 from mcp.server.fastmcp import FastMCP, Context, Image
 import socket
+import select
 import json
+import time
 import asyncio
 import logging
-from dataclasses import dataclass
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List
+import re
+import random
+import functools
+import threading
+import queue
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Iterable, Iterator, List, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("BlenderMCPServer")
 
+try:
+    import orjson  # Optional C-accelerated JSON; its errors subclass json.JSONDecodeError
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Polling of background jobs (Polyhaven downloads) running inside Blender
+JOB_POLL_INTERVAL = 0.25
+JOB_TIMEOUT = 600.0
+
+# Connections kept to the addon so independent tool calls don't queue behind one socket
+CONNECTION_POOL_SIZE = 4
+
+# Seconds a get_scene_info reply is reused, unless a command that may change the scene runs first
+SCENE_INFO_TTL = 0.5
+
+# Kernel socket buffer size requested for the Blender connection (capped by the OS limits)
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Seconds to wait on the socket; set once per connection rather than before every send/recv
+SOCKET_TIMEOUT = 15.0  # Match the addon's timeout
+
+# Seconds a connect may take; without it an unanswered SYN blocks for TCP's whole retry window
+CONNECT_TIMEOUT = 2.0
+
+# A connection that got a reply this recently is reused without probing its socket
+LIVENESS_GRACE = 1.0
+
+# Pauses before each retry of a refused connect, e.g. while the addon is still starting its server
+CONNECT_RETRY_DELAYS = (0.05, 0.2)
+
+# After a failed connect, further attempts fail fast for a delay that doubles up to this cap
+RECONNECT_BACKOFF_MAX = 2.0
+
+def _encode_frame(command: Dict[str, Any]) -> bytes:
+    """A command as sent to the addon: a 4-byte big-endian length, then the JSON payload"""
+    payload = _json_dumps(command)
+    return len(payload).to_bytes(4, 'big') + payload
+
+@functools.lru_cache(maxsize=128)
+def _cached_frame(command_type: str, params_key: Tuple) -> bytes:
+    """Frame of a command with scalar params given as sorted (name, value, type) triples; these repeat often"""
+    return _encode_frame({"type": command_type, "params": {name: value for name, value, _ in params_key}})
+
+def _command_frame(command_type: str, params: Dict[str, Any] = None) -> bytes:
+    """Frame for a command, reusing the encoding when every param is a hashable scalar"""
+    if not params:
+        return _cached_frame(command_type, ())
+    if all(value is None or isinstance(value, (str, int, float)) for value in params.values()):
+        # The type keeps equal-hashing values such as 1, 1.0 and True apart
+        return _cached_frame(command_type, tuple(sorted((name, value, type(value)) for name, value in params.items())))
+    return _encode_frame({"type": command_type, "params": params})
+
+def _envelope_result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Result of one reply envelope inside a pipeline or batch; {"error": message} if it failed"""
+    if response.get("status") == "error":
+        return {"error": response.get("message", "Unknown error from Blender")}
+    return response.get("result", {})
+
+class _JsonEndScanner:
+    """Track where a top-level JSON object or array ends, scanning each received byte once"""
+
+    _STRUCTURAL = re.compile(rb'[{}\[\]"]')
+    _STRING_SPECIAL = re.compile(rb'["\\]')
+
+    def __init__(self):
+        self.pos = 0  # Next byte to scan
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def scan(self, buf, end: int) -> int:
+        """Continue scanning buf[:end]; return the end offset of the value once it is complete, else -1"""
+        pos = self.pos
+        while pos < end:
+            if self.escape:
+                self.escape = False
+                pos += 1
+            elif self.in_string:
+                match = self._STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if buf[match.start()] == 0x5C:  # backslash
+                    self.escape = True
+                else:
+                    self.in_string = False
+            else:
+                match = self._STRUCTURAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                char = buf[match.start()]
+                pos = match.end()
+                if char == 0x22:  # opening quote
+                    self.in_string = True
+                elif char in b'{[':
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        self.pos = pos
+                        return pos
+        self.pos = pos
+        return -1
+
 @dataclass
 class BlenderConnection:
     host: str
     port: int
     sock: socket.socket = None  # Changed from 'socket' to 'sock' to avoid naming conflict
+    # Tools run on worker threads; keep each request/response exchange on the socket whole
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _leftover: bytes = field(default=b"", repr=False, compare=False)  # Start of the next reply
+    _last_ok: float = field(default=0.0, repr=False, compare=False)  # time.monotonic() of the last reply
     
     def connect(self) -> bool:
         """Connect to the Blender addon socket server"""
         if self.sock:
             return True
             
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Blender at {self.host}:{self.port}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to Blender: {str(e)}")
-            self.sock = None
-            return False
+        for delay in (0.0, *CONNECT_RETRY_DELAYS):
+            time.sleep(delay)
+            try:
+                self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._leftover = b""
+                # Small commands go out immediately instead of waiting on Nagle's algorithm
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Buffers are sized before connect so the TCP window is negotiated with them
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+                # Keepalive probes notice a vanished Blender on idle pooled connections
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if hasattr(socket, "TCP_KEEPIDLE"):  # Linux; elsewhere the OS defaults apply
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+                self.sock.settimeout(CONNECT_TIMEOUT)
+                self.sock.connect((self.host, self.port))
+                self.sock.settimeout(SOCKET_TIMEOUT)
+                logger.info(f"Connected to Blender at {self.host}:{self.port}")
+                return True
+            except Exception as e:
+                error = e
+                if self.sock:
+                    self.sock.close()
+                self.sock = None
+        logger.error(f"Failed to connect to Blender: {str(error)}")
+        return False
     
+    def is_alive(self) -> bool:
+        """Whether the connection can be reused; a reply within LIVENESS_GRACE seconds is proof enough"""
+        if self.sock is None:
+            return False
+        return time.monotonic() - self._last_ok < LIVENESS_GRACE or _socket_alive(self.sock)
+
     def disconnect(self):
         """Disconnect from the Blender addon"""
         if self.sock:
@@ -45,33 +202,42 @@ class BlenderConnection:
                 self.sock = None
 
     def receive_full_response(self, sock, buffer_size=8192):
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        # Use a consistent timeout value that matches the addon's timeout
-        sock.settimeout(15.0)  # Match the addon's timeout
+        """Receive one complete response: a length-prefixed frame, or a bare JSON value from older addons"""
+        # Replies to pipelined commands can arrive together; start with what the last call left over
+        buf = bytearray(self._leftover)
+        filled = len(buf)
+        self._leftover = b""
+        buf.extend(bytes(buffer_size))  # Filled in place by recv_into; no per-chunk bytes objects
+        # Only used for unframed replies: scans newly received bytes for the end of the value
+        scanner = _JsonEndScanner()
         
         try:
             while True:
                 try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
+                    start = end = -1
+                    if filled and buf[0] in b'{[':
+                        # Unframed reply: complete once the top-level JSON value closes
+                        start, end = 0, scanner.scan(buf, filled)
+                    elif filled >= 4:
+                        # Framed reply: a 4-byte big-endian length, then exactly that many bytes
+                        start, end = 4, 4 + int.from_bytes(buf[:4], 'big')
+                        if len(buf) < end:
+                            buf.extend(bytes(end - len(buf)))  # Grow once to the whole frame
+                    if end != -1 and end <= filled:
+                        data = bytes(memoryview(buf)[start:end])
+                        self._leftover = bytes(memoryview(buf)[end:filled])
+                        logger.debug("Received complete response (%d bytes)", len(data))
+                        return data
+                    
+                    if filled == len(buf):
+                        buf.extend(bytes(len(buf)))  # Double the buffer
+                    nbytes = sock.recv_into(memoryview(buf)[filled:])
+                    if not nbytes:
                         # If we get an empty chunk, the connection might be closed
-                        if not chunks:  # If we haven't received anything yet, this is an error
+                        if not filled:  # If we haven't received anything yet, this is an error
                             raise Exception("Connection closed before receiving any data")
                         break
-                    
-                    chunks.append(chunk)
-                    
-                    # Check if we've received a complete JSON object
-                    try:
-                        data = b''.join(chunks)
-                        json.loads(data.decode('utf-8'))
-                        # If we get here, it parsed successfully
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
+                    filled += nbytes
                 except socket.timeout:
                     # If we hit a timeout during receiving, break the loop and try to use what we have
                     logger.warning("Socket timeout during chunked receive")
@@ -86,13 +252,16 @@ class BlenderConnection:
             raise
             
         # If we get here, we either timed out or broke out of the loop
+        if filled and buf[0] not in b'{[':
+            # A partial frame can never be parsed
+            raise Exception("Incomplete response received")
         # Try to use what we have
-        if chunks:
-            data = b''.join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
+        if filled:
+            data = bytes(memoryview(buf)[:filled])
+            logger.debug("Returning data after receive completion (%d bytes)", len(data))
             try:
                 # Try to parse what we have
-                json.loads(data.decode('utf-8'))
+                _json_loads(data)
                 return data
             except json.JSONDecodeError:
                 # If we can't parse it, it's incomplete
@@ -102,46 +271,84 @@ class BlenderConnection:
 
     def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Blender and return the response"""
+        with self._lock:
+            return self._exchange(command_type, params)
+
+    def send_commands(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Pipeline (command_type, params) pairs: send them all at once, then match the replies by request id.
+
+        Returns each command's result in order; a command that failed yields {"error": message}.
+        """
+        with self._lock:
+            if not self.sock and not self.connect():
+                raise ConnectionError("Not connected to Blender")
+            
+            try:
+                frames = b''.join(
+                    _encode_frame({"type": command_type, "params": params or {}, "request_id": request_id})
+                    for request_id, (command_type, params) in enumerate(commands)
+                )
+                logger.debug("Sending %d pipelined commands", len(commands))
+                self.sock.sendall(frames)
+                
+                results = [None] * len(commands)
+                answered = set()
+                for index in range(len(commands)):
+                    response = _json_loads(self.receive_full_response(self.sock))
+                    # Addons that do not echo ids still reply in order
+                    request_id = response.get("request_id", index)
+                    if type(request_id) is not int or not 0 <= request_id < len(commands) or request_id in answered:
+                        raise Exception(f"Unexpected request id in reply: {request_id!r}")
+                    answered.add(request_id)
+                    results[request_id] = _envelope_result(response)
+                self._last_ok = time.monotonic()
+                return results
+            except Exception as e:
+                logger.error(f"Error communicating with Blender: {str(e)}")
+                # The replies are out of step with the commands now; start over on a new socket
+                self.disconnect()
+                raise Exception(f"Communication error with Blender: {str(e)}")
+
+    def send_batch(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run (command_type, params) pairs in order as one batch command: one frame each way.
+
+        Returns each command's result in order; a command that failed yields {"error": message}.
+        """
+        result = self.send_command("batch", {
+            "commands": [{"type": command_type, "params": params or {}} for command_type, params in commands]
+        })
+        return [_envelope_result(response) for response in result["results"]]
+
+    def _exchange(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """One request/response round trip; the caller holds the lock"""
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Blender")
         
-        command = {
-            "type": command_type,
-            "params": params or {}
-        }
-        
         try:
-            # Log the command being sent
-            logger.info(f"Sending command: {command_type} with params: {params}")
-            
-            # Send the command
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            logger.info(f"Command sent, waiting for response...")
+            # Per-command logs are DEBUG with lazy arguments: params can be a whole script
+            logger.debug("Sending command: %s with params: %s", command_type, params)
             
-            # Set a timeout for receiving - use the same timeout as in receive_full_response
-            self.sock.settimeout(15.0)  # Match the addon's timeout
+            # Send the command, length-prefixed so the addon replies with a frame of the same kind
+            self.sock.sendall(_command_frame(command_type, params))
+            logger.debug("Command sent, waiting for response...")
             
             # Receive the response using the improved receive_full_response method
             response_data = self.receive_full_response(self.sock)
-            logger.info(f"Received {len(response_data)} bytes of data")
-            
-            response = json.loads(response_data.decode('utf-8'))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+            logger.debug("Received %d bytes of data", len(response_data))
             
-            if response.get("status") == "error":
-                logger.error(f"Blender error: {response.get('message')}")
-                raise Exception(response.get("message", "Unknown error from Blender"))
+            response = _json_loads(response_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response parsed, status: %s", response.get('status', 'unknown'))
             
-            return response.get("result", {})
+            self._last_ok = time.monotonic()
         except socket.timeout:
             logger.error("Socket timeout while waiting for response from Blender")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            # Just invalidate the current socket so it will be recreated next time
-            self.sock = None
+            # Don't try to reconnect here; the pool opens a new connection for the next call
+            self.disconnect()
             raise Exception("Timeout waiting for Blender response - try simplifying your request")
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
             logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+            self.disconnect()
             raise Exception(f"Connection to Blender lost: {str(e)}")
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from Blender: {str(e)}")
@@ -151,15 +358,62 @@ class BlenderConnection:
             raise Exception(f"Invalid response from Blender: {str(e)}")
         except Exception as e:
             logger.error(f"Error communicating with Blender: {str(e)}")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            self.sock = None
+            # Don't try to reconnect here; the pool opens a new connection for the next call
+            self.disconnect()
             raise Exception(f"Communication error with Blender: {str(e)}")
+        
+        # An error reply is a complete exchange: the connection stays usable
+        if response.get("status") == "error":
+            logger.error(f"Blender error: {response.get('message')}")
+            raise Exception(response.get("message", "Unknown error from Blender"))
+        return response.get("result", {})
+
+class BlenderConnectionPool:
+    """Up to `size` connections to the addon, each handed to one caller at a time"""
+
+    def __init__(self, host: str, port: int, size: int = CONNECTION_POOL_SIZE):
+        self.host = host
+        self.port = port
+        self._idle = queue.LifoQueue()  # Most recently used first, while its socket is warm
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def acquire(self) -> Iterator[BlenderConnection]:
+        """Borrow a live connection, opening one if none is idle; blocks while all are in use"""
+        with self._slots:
+            connection = self._take_idle()
+            if connection is None:
+                connection = _open_connection(self.host, self.port)
+            try:
+                yield connection
+            finally:
+                # send_command drops the socket on failure; such connections are not reused
+                if connection.sock is not None:
+                    self._idle.put(connection)
+
+    def _take_idle(self):
+        """Pop the most recent idle connection that is still alive, closing dead ones on the way"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if connection.is_alive():
+                return connection
+            connection.disconnect()
+
+    def close(self):
+        """Disconnect every idle connection"""
+        while True:
+            try:
+                self._idle.get_nowait().disconnect()
+            except queue.Empty:
+                return
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Manage server startup and shutdown lifecycle"""
-    # We don't need to create a connection here since we're using the global connection
-    # for resources and tools
+    # Tools borrow connections from the module-level pool rather than the lifespan context
     
     try:
         # Just log that we're starting up
@@ -167,22 +421,18 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         
         # Try to connect to Blender on startup to verify it's available
         try:
-            # This will initialize the global connection if needed
-            blender = get_blender_connection()
+            # Open the pooled connections concurrently, so the first parallel tool calls find them ready
+            await asyncio.gather(*(_send_command("get_polyhaven_status") for _ in range(CONNECTION_POOL_SIZE)))
             logger.info("Successfully connected to Blender on startup")
         except Exception as e:
             logger.warning(f"Could not connect to Blender on startup: {str(e)}")
             logger.warning("Make sure the Blender addon is running before using Blender resources or tools")
         
-        # Return an empty context - we're using the global connection
+        # Return an empty context - tools use the global connection pool
         yield {}
     finally:
-        # Clean up the global connection on shutdown
-        global _blender_connection
-        if _blender_connection:
-            logger.info("Disconnecting from Blender on shutdown")
-            _blender_connection.disconnect()
-            _blender_connection = None
+        # Clean up the connections on shutdown
+        _connection_pool.close()
         logger.info("BlenderMCP server shut down")
 
 # Create the MCP server with lifespan support
@@ -194,58 +444,124 @@ mcp = FastMCP(
 
 # Resource endpoints
 
-# Global connection for resources (since resources can't access context)
-_blender_connection = None
-_polyhaven_enabled = False  # Add this global variable
+# Connection state shared by every tool (tools can't reach the lifespan context)
+_reconnect_lock = threading.Lock()
+_reconnect_backoff = 0.0  # Current delay after failed connects; 0 while Blender is reachable
+_next_reconnect = 0.0  # time.monotonic() before which connects are not attempted
+_connection_pool = BlenderConnectionPool(host="localhost", port=9876)
 
-def get_blender_connection():
-    """Get or create a persistent Blender connection"""
-    global _blender_connection, _polyhaven_enabled  # Add _polyhaven_enabled to globals
-    
-    # If we have an existing connection, check if it's still valid
-    if _blender_connection is not None:
-        try:
-            # First check if PolyHaven is enabled by sending a ping command
-            result = _blender_connection.send_command("get_polyhaven_status")
-            # Store the PolyHaven status globally
-            _polyhaven_enabled = result.get("enabled", False)
-            return _blender_connection
-        except Exception as e:
-            # Connection is dead, close it and create a new one
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
-            try:
-                _blender_connection.disconnect()
-            except:
-                pass
-            _blender_connection = None
+# include_counts -> (fetch time, formatted get_scene_info reply)
+_scene_info_cache: Dict[bool, Tuple[float, str]] = {}
+# Bumped when a mutating command starts and ends; a fetch that saw it change is not cached
+_scene_info_generation = 0
+
+# Default transform values for create_object
+_ORIGIN = (0.0, 0.0, 0.0)
+_UNIT_SCALE = (1.0, 1.0, 1.0)
+
+# Commands that never change the scene; any other command invalidates the scene info cache
+_READ_ONLY_COMMANDS = frozenset({
+    "get_scene_info",
+    "get_object_info",
+    "get_polyhaven_status",
+    "get_polyhaven_categories",
+    "search_polyhaven_assets",
+})
+
+def _socket_alive(sock: socket.socket) -> bool:
+    """Cheap liveness probe: a peer that closed the connection leaves the socket readable but empty"""
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return not readable or bool(sock.recv(1, socket.MSG_PEEK))
+    except OSError:
+        return False
+
+def _open_connection(host: str, port: int) -> BlenderConnection:
+    """Connect a new BlenderConnection, failing fast while an earlier failure is backing off"""
+    global _reconnect_backoff, _next_reconnect
     
-    # Create a new connection if needed
-    if _blender_connection is None:
-        _blender_connection = BlenderConnection(host="localhost", port=9876)
-        if not _blender_connection.connect():
-            logger.error("Failed to connect to Blender")
-            _blender_connection = None
-            raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
-        logger.info("Created new persistent connection to Blender")
+    if time.monotonic() < _next_reconnect:
+        raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
+    connection = BlenderConnection(host=host, port=port)
+    if not connection.connect():
+        with _reconnect_lock:
+            # Double the delay from 50 ms, with jitter so waiting callers don't retry in lockstep
+            _reconnect_backoff = min(_reconnect_backoff * 2 or 0.05, RECONNECT_BACKOFF_MAX)
+            _next_reconnect = time.monotonic() + _reconnect_backoff * (1 + random.random())
+        logger.error("Failed to connect to Blender")
+        raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
+    with _reconnect_lock:
+        _reconnect_backoff = 0.0
+        _next_reconnect = 0.0
+    return connection
+
+def _pooled_call(call: Callable[[BlenderConnection], Any]) -> Any:
+    """Run call(connection) on a connection borrowed from the pool"""
+    with _connection_pool.acquire() as connection:
+        return call(connection)
+
+async def _run_pooled(command_types: Iterable[str], call: Callable[[BlenderConnection], Any]) -> Any:
+    """Run call on a pooled connection from a worker thread, so a slow Blender call never blocks the event loop"""
+    global _scene_info_generation
     
-    return _blender_connection
+    mutating = not _READ_ONLY_COMMANDS.issuperset(command_types)
+    if mutating:
+        _scene_info_generation += 1
+    try:
+        return await asyncio.to_thread(_pooled_call, call)
+    finally:
+        if mutating:
+            _scene_info_generation += 1
+            _scene_info_cache.clear()
+
+async def _send_command(command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Send one command and return its result"""
+    return await _run_pooled((command_type,), lambda connection: connection.send_command(command_type, params))
+
+async def _send_commands(commands: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Pipeline several commands on one connection; a failed command yields {"error": message}"""
+    return await _run_pooled(
+        [command_type for command_type, _ in commands],
+        lambda connection: connection.send_commands(commands),
+    )
+
+async def _send_batch(commands: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Run several commands as one batch command; a failed command yields {"error": message}"""
+    return await _run_pooled(
+        [command_type for command_type, _ in commands],
+        lambda connection: connection.send_batch(commands),
+    )
 
 
 @mcp.tool()
-def get_scene_info(ctx: Context) -> str:
-    """Get detailed information about the current Blender scene"""
+async def get_scene_info(ctx: Context, include_counts: bool = False) -> str:
+    """
+    Get detailed information about the current Blender scene.
+    
+    Parameters:
+    - include_counts: Also report the total object and material counts (slower on large scenes)
+    """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_scene_info")
+        # Agents re-read the scene between steps; reuse a reply fetched moments ago
+        cached = _scene_info_cache.get(include_counts)
+        if cached and time.monotonic() - cached[0] < SCENE_INFO_TTL:
+            return cached[1]
+        
+        generation = _scene_info_generation
+        result = await _send_command("get_scene_info", {"include_counts": include_counts})
         
         # Just return the JSON representation of what Blender sent us
-        return json.dumps(result, indent=2)
+        formatted = _json_pretty(result)
+        # A mutation overlapping the fetch may not be reflected in it
+        if generation == _scene_info_generation:
+            _scene_info_cache[include_counts] = (time.monotonic(), formatted)
+        return formatted
     except Exception as e:
         logger.error(f"Error getting scene info from Blender: {str(e)}")
         return f"Error getting scene info: {str(e)}"
 
 @mcp.tool()
-def get_object_info(ctx: Context, object_name: str) -> str:
+async def get_object_info(ctx: Context, object_name: str) -> str:
     """
     Get detailed information about a specific object in the Blender scene.
     
@@ -253,19 +569,36 @@ def get_object_info(ctx: Context, object_name: str) -> str:
     - object_name: The name of the object to get information about
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {"name": object_name})
+        result = await _send_command("get_object_info", {"name": object_name})
         
         # Just return the JSON representation of what Blender sent us
-        return json.dumps(result, indent=2)
+        return _json_pretty(result)
     except Exception as e:
         logger.error(f"Error getting object info from Blender: {str(e)}")
         return f"Error getting object info: {str(e)}"
 
+@mcp.tool()
+async def get_objects_info(ctx: Context, object_names: List[str]) -> str:
+    """
+    Get detailed information about several objects in the Blender scene in one request.
+    
+    Parameters:
+    - object_names: The names of the objects to get information about
+    
+    Returns a JSON object mapping each name to its information, or to {"error": message}.
+    """
+    try:
+        # Pipelined: every request goes out before the first reply is read
+        results = await _send_commands([("get_object_info", {"name": name}) for name in object_names])
+        return _json_pretty(dict(zip(object_names, results)))
+    except Exception as e:
+        logger.error(f"Error getting objects info from Blender: {str(e)}")
+        return f"Error getting objects info: {str(e)}"
+
 
 
 @mcp.tool()
-def create_object(
+async def create_object(
     ctx: Context,
     type: str = "CUBE",
     name: str = None,
@@ -281,7 +614,9 @@ def create_object(
     minor_radius: float = 0.25,
     abso_major_rad: float = 1.25,
     abso_minor_rad: float = 0.75,
-    generate_uvs: bool = True
+    generate_uvs: bool = True,
+    color: List[float] = None,
+    material_name: str = None
 ) -> str:
     """
     Create a new object in the Blender scene.
@@ -292,6 +627,8 @@ def create_object(
     - location: Optional [x, y, z] location coordinates
     - rotation: Optional [x, y, z] rotation in radians
     - scale: Optional [x, y, z] scale factors (not used for TORUS)
+    - color: Optional [R, G, B] color values (0.0-1.0) for the object's material
+    - material_name: Optional name of the material to use or create
     
     Torus-specific parameters (only used when type == "TORUS"):
     - align: How to align the torus ('WORLD', 'VIEW', or 'CURSOR')
@@ -308,13 +645,10 @@ def create_object(
     A message indicating the created object name.
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
-        # Set default values for missing parameters
-        loc = location or [0, 0, 0]
-        rot = rotation or [0, 0, 0]
-        sc = scale or [1, 1, 1]
+        # Set default values for missing parameters (shared tuples; JSON encodes them as arrays)
+        loc = location or _ORIGIN
+        rot = rotation or _ORIGIN
+        sc = scale or _UNIT_SCALE
         
         params = {
             "type": type,
@@ -324,6 +658,11 @@ def create_object(
         
         if name:
             params["name"] = name
+        # The addon applies the material in the same command, saving a set_material round trip
+        if color:
+            params["color"] = color
+        if material_name:
+            params["material_name"] = material_name
 
         if type == "TORUS":
             # For torus, the scale is not used.
@@ -338,20 +677,52 @@ def create_object(
                 "abso_minor_rad": abso_minor_rad,
                 "generate_uvs": generate_uvs
             })
-            result = blender.send_command("create_object", params)
-            return f"Created {type} object: {result['name']}"
         else:
             # For non-torus objects, include scale
             params["scale"] = sc
-            result = blender.send_command("create_object", params)
-            return f"Created {type} object: {result['name']}"
+        
+        result = await _send_command("create_object", params)
+        message = f"Created {type} object: {result['name']}"
+        material = result.get("material")
+        if material:
+            if material.get("status") == "error":
+                message += f" (material not applied: {material.get('message')})"
+            else:
+                message += f" with material {material.get('material')}"
+        return message
     except Exception as e:
         logger.error(f"Error creating object: {str(e)}")
         return f"Error creating object: {str(e)}"
 
 
 @mcp.tool()
-def modify_object(
+async def create_objects(ctx: Context, objects: List[Dict[str, Any]]) -> str:
+    """
+    Create several objects in the Blender scene in one request.
+    
+    Parameters:
+    - objects: List of object specs, each taking the same keys as create_object
+      (type, name, location, rotation, scale, color, material_name, and the torus parameters)
+    
+    Returns one line per object with the created name or the error.
+    """
+    try:
+        # One batch command: a single round trip however many objects are created
+        results = await _send_batch([("create_object", spec) for spec in objects])
+        lines = []
+        for spec, created in zip(objects, results):
+            if "error" in created:
+                lines.append(f"Error creating {spec.get('type', 'CUBE')} object: {created['error']}")
+            else:
+                lines.append(f"Created {spec.get('type', 'CUBE')} object: {created['name']}")
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error creating objects: {str(e)}")
+        return f"Error creating objects: {str(e)}"
+
+
+@mcp.tool()
+async def modify_object(
     ctx: Context,
     name: str,
     location: List[float] = None,
@@ -370,9 +741,6 @@ def modify_object(
     - visible: Optional boolean to set visibility
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
         params = {"name": name}
         
         if location is not None:
@@ -384,14 +752,14 @@ def modify_object(
         if visible is not None:
             params["visible"] = visible
             
-        result = blender.send_command("modify_object", params)
+        result = await _send_command("modify_object", params)
         return f"Modified object: {result['name']}"
     except Exception as e:
         logger.error(f"Error modifying object: {str(e)}")
         return f"Error modifying object: {str(e)}"
 
 @mcp.tool()
-def delete_object(ctx: Context, name: str) -> str:
+async def delete_object(ctx: Context, name: str) -> str:
     """
     Delete an object from the Blender scene.
     
@@ -399,17 +767,14 @@ def delete_object(ctx: Context, name: str) -> str:
     - name: Name of the object to delete
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
-        result = blender.send_command("delete_object", {"name": name})
+        result = await _send_command("delete_object", {"name": name})
         return f"Deleted object: {name}"
     except Exception as e:
         logger.error(f"Error deleting object: {str(e)}")
         return f"Error deleting object: {str(e)}"
 
 @mcp.tool()
-def set_material(
+async def set_material(
     ctx: Context,
     object_name: str,
     material_name: str = None,
@@ -424,9 +789,6 @@ def set_material(
     - color: Optional [R, G, B] color values (0.0-1.0)
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
         params = {"object_name": object_name}
         
         if material_name:
@@ -434,14 +796,14 @@ def set_material(
         if color:
             params["color"] = color
             
-        result = blender.send_command("set_material", params)
+        result = await _send_command("set_material", params)
         return f"Applied material to {object_name}: {result.get('material_name', 'unknown')}"
     except Exception as e:
         logger.error(f"Error setting material: {str(e)}")
         return f"Error setting material: {str(e)}"
 
 @mcp.tool()
-def execute_blender_code(ctx: Context, code: str) -> str:
+async def execute_blender_code(ctx: Context, code: str) -> str:
     """
     Execute arbitrary Python code in Blender.
     
@@ -449,17 +811,14 @@ def execute_blender_code(ctx: Context, code: str) -> str:
     - code: The Python code to execute
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
-        result = blender.send_command("execute_code", {"code": code})
+        result = await _send_command("execute_code", {"code": code})
         return f"Code executed successfully: {result.get('result', '')}"
     except Exception as e:
         logger.error(f"Error executing code: {str(e)}")
         return f"Error executing code: {str(e)}"
 
 @mcp.tool()
-def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
+async def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     """
     Get a list of categories for a specific asset type on Polyhaven.
     
@@ -467,10 +826,11 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     - asset_type: The type of asset to get categories for (hdris, textures, models, all)
     """
     try:
-        blender = get_blender_connection()
-        if not _polyhaven_enabled:
+        # The status can change in the addon at any time, so ask for it
+        status = await _send_command("get_polyhaven_status")
+        if not status.get("enabled", False):
             return "PolyHaven integration is disabled. Select it in the sidebar in BlenderMCP, then run it again."
-        result = blender.send_command("get_polyhaven_categories", {"asset_type": asset_type})
+        result = await _send_command("get_polyhaven_categories", {"asset_type": asset_type})
         
         if "error" in result:
             return f"Error: {result['error']}"
@@ -491,7 +851,7 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
         return f"Error getting Polyhaven categories: {str(e)}"
 
 @mcp.tool()
-def search_polyhaven_assets(
+async def search_polyhaven_assets(
     ctx: Context,
     asset_type: str = "all",
     categories: str = None
@@ -506,8 +866,7 @@ def search_polyhaven_assets(
     Returns a list of matching assets with basic information.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("search_polyhaven_assets", {
+        result = await _send_command("search_polyhaven_assets", {
             "asset_type": asset_type,
             "categories": categories
         })
@@ -540,7 +899,7 @@ def search_polyhaven_assets(
         return f"Error searching Polyhaven assets: {str(e)}"
 
 @mcp.tool()
-def download_polyhaven_asset(
+async def download_polyhaven_asset(
     ctx: Context,
     asset_id: str,
     asset_type: str,
@@ -559,14 +918,24 @@ def download_polyhaven_asset(
     Returns a message indicating success or failure.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("download_polyhaven_asset", {
+        result = await _send_command("download_polyhaven_asset", {
             "asset_id": asset_id,
             "asset_type": asset_type,
             "resolution": resolution,
             "file_format": file_format
         })
         
+        # The download runs as a background job in Blender; wait for it to finish
+        job_id = result.get("job_id")
+        deadline = time.monotonic() + JOB_TIMEOUT
+        while job_id is not None and result.get("status") == "running":
+            if time.monotonic() > deadline:
+                return f"Error: Timed out waiting for asset {asset_id} to download"
+            await asyncio.sleep(JOB_POLL_INTERVAL)
+            result = await _send_command("poll_job", {"job_id": job_id})
+        if job_id is not None:
+            result = result["result"]
+        
         if "error" in result:
             return f"Error: {result['error']}"
         
@@ -591,7 +960,7 @@ def download_polyhaven_asset(
         return f"Error downloading Polyhaven asset: {str(e)}"
 
 @mcp.tool()
-def set_texture(
+async def set_texture(
     ctx: Context,
     object_name: str,
     texture_id: str
@@ -606,10 +975,7 @@ def set_texture(
     Returns a message indicating success or failure.
     """
     try:
-        # Get the global connection
-        blender = get_blender_connection()
-        
-        result = blender.send_command("set_texture", {
+        result = await _send_command("set_texture", {
             "object_name": object_name,
             "texture_id": texture_id
         })
@@ -651,14 +1017,13 @@ def set_texture(
         return f"Error applying texture: {str(e)}"
 
 @mcp.tool()
-def get_polyhaven_status(ctx: Context) -> str:
+async def get_polyhaven_status(ctx: Context) -> str:
     """
     Check if PolyHaven integration is enabled in Blender.
     Returns a message indicating whether PolyHaven features are available.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_polyhaven_status")
+        result = await _send_command("get_polyhaven_status")
         enabled = result.get("enabled", False)
         message = result.get("message", "")
         